@@ -5,9 +5,19 @@ reallocation recommendations.
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 from dotenv import load_dotenv
 
+from utils.anonymizer import (
+    anonymize_lender,
+    round_score,
+    band_percentage,
+    format_amount_range,
+    group_region,
+    band_turnover,
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -27,6 +37,10 @@ class Explainer:
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.client = None
+        # Generated text keyed by prompt; prompts are built from stable loan
+        # data, so repeat requests reuse the first response. Bounded like the
+        # backend's Gemini cache so a long session can't grow it forever
+        self._generate_content = lru_cache(maxsize=256)(self._request_content)
 
         if self.api_key:
             try:
@@ -41,6 +55,18 @@ class Explainer:
             except Exception as e:
                 print(f"Warning: Could not initialize Gemini client: {e}")
 
+    def _request_content(self, prompt: str) -> str:
+        """
+        Generate text for a prompt. Called through the _generate_content cache.
+
+        Errors from the API propagate so callers can fall back to templates;
+        failed calls are not cached.
+        """
+        response = self.client.models.generate_content(
+            model=self.model, contents=prompt
+        )
+        return response.text
+
     def generate_explanation(
         self,
         company_data: Dict,
@@ -149,10 +175,7 @@ class Explainer:
         portfolio and return implications for each party under this scenario.
         """
         try:
-            response = self.client.models.generate_content(
-                model=self.model, contents=prompt
-            )
-            return response.text
+            return self._generate_content(prompt)
         except Exception as e:
             print(f"LLM API error: {e}")
             return self._generate_template(
@@ -275,10 +298,7 @@ class Explainer:
 Focus on the opportunity and benefit for the SME lending market."""
 
             try:
-                response = self.client.models.generate_content(
-                    model=self.model, contents=prompt
-                )
-                return response.text
+                return self._generate_content(prompt)
             except Exception:
                 pass
 
@@ -309,10 +329,7 @@ Focus on the opportunity and benefit for the SME lending market."""
 Emphasize the virtuous cycle: more appropriate loans -> more business success -> more lending demand."""
 
             try:
-                response = self.client.models.generate_content(
-                    model=self.model, contents=prompt
-                )
-                return response.text
+                return self._generate_content(prompt)
             except Exception:
                 pass
 
@@ -363,10 +380,7 @@ The story should emphasize:
 Keep the tone professional but impactful. Avoid hyperbole."""
 
             try:
-                response = self.client.models.generate_content(
-                    model=self.model, contents=prompt
-                )
-                return response.text
+                return self._generate_content(prompt)
             except Exception:
                 pass
 
@@ -408,15 +422,6 @@ def prepare_explanation_data(
     Returns:
         Tuple of (company_data, current_lender, recommended_lender, scores, pricing)
     """
-    from utils.anonymizer import (
-        anonymize_lender,
-        round_score,
-        band_percentage,
-        format_amount_range,
-        group_region,
-        band_turnover,
-    )
-
     if anonymize:
         # Anonymize region and band turnover
         region_display = group_region(company.get("Region", "Unknown"))
@@ -80,14 +80,14 @@ class InclusionScanner:
         # Add inclusion flags
         df['Inclusion_Flags'] = df.apply(self._generate_flags, axis=1)
 
-        # Add inclusion category
-        df['Inclusion_Category'] = df['Inclusion_Score'].apply(self._categorize_inclusion)
+        # Add inclusion category (categorical: only four distinct labels)
+        df['Inclusion_Category'] = pd.Categorical(self._categorize_inclusion(df['Inclusion_Score']))
 
         return df
 
     def _calculate_regional_stats(self, df: pd.DataFrame) -> Dict:
         """Calculate statistics by region."""
-        return df.groupby('Region').agg({
+        return df.groupby('Region', observed=True).agg({
             'Turnover': 'mean',
             'Risk_Score': 'mean',
             'SME_ID': 'count'
@@ -95,12 +95,25 @@ class InclusionScanner:
 
     def _calculate_sector_stats(self, df: pd.DataFrame) -> Dict:
         """Calculate statistics by sector."""
-        return df.groupby('Sector').agg({
+        return df.groupby('Sector', observed=True).agg({
             'Turnover': 'mean',
             'Risk_Score': 'mean',
             'SME_ID': 'count'
         }).rename(columns={'SME_ID': 'count'}).to_dict('index')
 
+    @staticmethod
+    def _score_distinct(values: pd.Series, score) -> np.ndarray:
+        """
+        Score each distinct value once and broadcast back to every row.
+
+        There are only a handful of regions and sectors, so this replaces a
+        Python call per row with one per distinct value and an array lookup.
+        Missing values (code -1) pick up the score for NaN, stored last.
+        """
+        codes, uniques = pd.factorize(values)
+        lookup = np.array([score(value) for value in uniques] + [score(np.nan)])
+        return lookup[codes]
+
     def _calculate_regional_score(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate regional inclusion score.
@@ -123,7 +136,7 @@ class InclusionScanner:
             else:
                 return 45  # Neutral
 
-        df['Regional_Inclusion_Score'] = df['Region'].apply(score_region)
+        df['Regional_Inclusion_Score'] = self._score_distinct(df['Region'], score_region)
         return df
 
     def _calculate_sector_score(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -142,7 +155,7 @@ class InclusionScanner:
             else:
                 return 50  # Neutral
 
-        df['Sector_Inclusion_Score'] = df['Sector'].apply(score_sector)
+        df['Sector_Inclusion_Score'] = self._score_distinct(df['Sector'], score_sector)
         return df
 
     def _calculate_size_score(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -222,16 +235,13 @@ class InclusionScanner:
 
         return flags
 
-    def _categorize_inclusion(self, score: float) -> str:
-        """Categorize inclusion score."""
-        if score >= 75:
-            return "High Inclusion Priority"
-        elif score >= 60:
-            return "Moderate Inclusion Priority"
-        elif score >= 45:
-            return "Standard"
-        else:
-            return "Well-Served"
+    def _categorize_inclusion(self, scores: pd.Series) -> np.ndarray:
+        """Categorize inclusion scores."""
+        return np.select(
+            [scores >= 75, scores >= 60, scores >= 45],
+            ["High Inclusion Priority", "Moderate Inclusion Priority", "Standard"],
+            default="Well-Served"
+        )
 
     def get_inclusion_breakdown(self, company: pd.Series, anonymize: bool = False) -> Dict:
         """
@@ -312,14 +322,14 @@ class InclusionScanner:
         total = len(df)
 
         # Regional analysis
-        underserved_region_count = len(df[df['Region'].isin(self.UNDERSERVED_REGIONS)])
+        underserved_region_count = int(df['Region'].isin(self.UNDERSERVED_REGIONS).sum())
         underserved_region_pct = underserved_region_count / total * 100
 
         # High potential in underserved
-        high_potential_underserved = len(df[
+        high_potential_underserved = int((
             (df['Risk_Score'] >= 65) &
             (df['Inclusion_Score'] >= 60)
-        ])
+        ).sum())
 
         # Sector analysis
         sector_distribution = df['Sector'].value_counts().to_dict()
@@ -356,8 +366,9 @@ class InclusionScanner:
 
     def _generate_key_insight(self, df: pd.DataFrame) -> str:
         """Generate a key insight statement."""
-        high_priority = len(df[df['Inclusion_Category'] == 'High Inclusion Priority'])
-        strong_overlooked = len(df[df['Inclusion_Flags'].apply(lambda x: 'Strong but Overlooked' in x)])
+        # Count straight off the boolean masks; no filtered frame is needed
+        high_priority = int((df['Inclusion_Category'] == 'High Inclusion Priority').sum())
+        strong_overlooked = int(df['Inclusion_Flags'].apply(lambda x: 'Strong but Overlooked' in x).sum())
 
         return (
             f"{high_priority} companies ({high_priority/len(df)*100:.0f}%) are high inclusion priority. "
@@ -6,24 +6,43 @@ and generates reallocation recommendations.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from lenders.profiles import LENDERS, get_lender
 from utils.anonymizer import (
     anonymize_lender,
+    build_lender_anon_map,
     round_score,
     band_turnover,
     group_region,
     anonymize_fit_reason,
+    band_percentage,
+    band_portfolio_total,
     reset_lender_mapping,
 )
 
 
+def _round1(value: float) -> float:
+    """Round a score or percentage to one decimal for un-anonymized display."""
+    return round(value, 1)
+
+
+def _fmt_millions(value: float) -> str:
+    """Format a GBP amount in millions, e.g. '£1.2M'."""
+    return f"£{value / 1e6:.1f}M"
+
+
 class Matcher:
     """
     Matches companies to lenders based on fit scoring.
     Identifies unalignes and recommends reallocations.
     """
 
+    # Statuses that count as reallocation candidates (strong or moderate)
+    CANDIDATE_STATUSES = (
+        "STRONG REALLOCATION CANDIDATE",
+        "MODERATE REALLOCATION CANDIDATE",
+    )
+
     def __init__(self):
         self.fit_threshold_strong = 30  # Gap for strong reallocation candidate
         self.fit_threshold_moderate = 15  # Gap for moderate candidate
@@ -47,17 +66,28 @@ class Matcher:
         )
 
         # Calculate fit with all lenders and find best match
-        fit_results = df.apply(self._find_best_match, axis=1)
-        df["Best_Match_Lender"] = fit_results.apply(lambda x: x["best_lender"])
-        df["Best_Match_Fit"] = fit_results.apply(lambda x: x["best_fit"])
-        df["Best_Match_Reasons"] = fit_results.apply(lambda x: x["best_reasons"])
-        df["All_Lender_Fits"] = fit_results.apply(lambda x: x["all_fits"])
+        # Unpack the per-row result dicts into columns in one pass rather
+        # than one lambda apply per field
+        fit_results = pd.DataFrame.from_records(
+            df.apply(self._find_best_match, axis=1).tolist(), index=df.index
+        )
+        # Categorical over the known lenders, like Current_Lender, so
+        # per-lender masks compare integer codes rather than strings
+        df["Best_Match_Lender"] = pd.Categorical(
+            fit_results["best_lender"], categories=list(LENDERS)
+        )
+        df["Best_Match_Fit"] = fit_results["best_fit"]
+        df["Best_Match_Reasons"] = fit_results["best_reasons"]
+        df["All_Lender_Fits"] = fit_results["all_fits"]
 
         # Calculate fit gap
         df["Fit_Gap"] = df["Best_Match_Fit"] - df["Current_Lender_Fit"]
 
-        # Determine reallocation recommendation
-        df["Reallocation_Status"] = df["Fit_Gap"].apply(self._categorize_reallocation)
+        # Determine reallocation recommendation; a handful of labels, so
+        # stored as categorical like the lender columns
+        df["Reallocation_Status"] = pd.Categorical(
+            self._categorize_reallocation(df["Fit_Gap"])
+        )
 
         # Is it a unalign?
         df["Is_Unalign"] = df["Fit_Gap"] > self.fit_threshold_moderate
@@ -206,16 +236,21 @@ class Matcher:
             "all_fits": all_fits,
         }
 
-    def _categorize_reallocation(self, fit_gap: float) -> str:
+    def _categorize_reallocation(self, fit_gaps: pd.Series) -> np.ndarray:
         """Categorize the reallocation recommendation."""
-        if fit_gap >= self.fit_threshold_strong:
-            return "STRONG REALLOCATION CANDIDATE"
-        elif fit_gap >= self.fit_threshold_moderate:
-            return "MODERATE REALLOCATION CANDIDATE"
-        elif fit_gap > 0:
-            return "MINOR IMPROVEMENT POSSIBLE"
-        else:
-            return "ADEQUATE FIT - NO ACTION"
+        return np.select(
+            [
+                fit_gaps >= self.fit_threshold_strong,
+                fit_gaps >= self.fit_threshold_moderate,
+                fit_gaps > 0,
+            ],
+            [
+                "STRONG REALLOCATION CANDIDATE",
+                "MODERATE REALLOCATION CANDIDATE",
+                "MINOR IMPROVEMENT POSSIBLE",
+            ],
+            default="ADEQUATE FIT - NO ACTION",
+        )
 
     def get_reallocation_recommendation(
         self, company: pd.Series, anonymize: bool = False
@@ -251,13 +286,13 @@ class Matcher:
 
             # Anonymize all lender fits (except current)
             all_fits = company.get("All_Lender_Fits", {})
-            anon_all_fits = {}
-            for lender_name, fit in all_fits.items():
-                if lender_name == current_lender:
-                    anon_all_fits[lender_name] = round_score(fit)
-                else:
-                    anon_name = anonymize_lender(lender_name, is_current=False)
-                    anon_all_fits[anon_name] = round_score(fit)
+            anon_names = build_lender_anon_map(
+                name for name in all_fits if name != current_lender
+            )
+            anon_all_fits = {
+                anon_names.get(lender_name, lender_name): round_score(fit)
+                for lender_name, fit in all_fits.items()
+            }
         else:
             display_best_lender = best_lender
             display_region = company.get("Region", "Unknown")
@@ -295,7 +330,12 @@ class Matcher:
         }
 
     def get_reallocation_candidates(
-        self, df: pd.DataFrame, status_filter: str = None
+        self,
+        df: pd.DataFrame,
+        status_filter: str = None,
+        top_k: Optional[int] = None,
+        sector: Optional[str] = None,
+        lender: Optional[str] = None,
     ) -> pd.DataFrame:
         """
         Get all companies that are reallocation candidates.
@@ -303,22 +343,32 @@ class Matcher:
         Args:
             df: DataFrame with fit scores
             status_filter: Optional filter ('STRONG', 'MODERATE', or None for all)
+            top_k: If set, only return the top_k candidates by fit gap
+            sector: If set, only include companies in this sector
+            lender: If set, only include loans currently held by this lender
 
         Returns:
             DataFrame of reallocation candidates
         """
-        candidates = df[df["Is_Unalign"] == True].copy()
+        # AND every predicate into one boolean array and index once; each
+        # column is scanned a single time and no intermediate frames are built
+        mask = df["Is_Unalign"].to_numpy(dtype=bool)
 
         if status_filter == "STRONG":
-            candidates = candidates[
-                candidates["Reallocation_Status"] == "STRONG REALLOCATION CANDIDATE"
-            ]
+            mask = mask & (
+                df["Reallocation_Status"].to_numpy() == "STRONG REALLOCATION CANDIDATE"
+            )
         elif status_filter == "MODERATE":
-            candidates = candidates[
-                candidates["Reallocation_Status"].str.contains("CANDIDATE")
-            ]
+            mask = mask & df["Reallocation_Status"].isin(self.CANDIDATE_STATUSES).to_numpy()
+        if sector is not None:
+            mask = mask & (df["Sector"] == sector).to_numpy()
+        if lender is not None:
+            mask = mask & (df["Current_Lender"] == lender).to_numpy()
 
-        return candidates.sort_values("Fit_Gap", ascending=False)
+        # A partial selection is enough when only the top few are needed
+        if top_k is not None:
+            return df.loc[mask].nlargest(top_k, "Fit_Gap")
+        return df.loc[mask].sort_values("Fit_Gap", ascending=False)
 
     def get_market_summary(self, df: pd.DataFrame, anonymize: bool = False) -> Dict:
         """
@@ -329,76 +379,71 @@ class Matcher:
             anonymize: If True, anonymize lender names and band values
         """
         total = len(df)
-        unalignes = len(df[df["Is_Unalign"] == True])
-        strong_candidates = len(
-            df[df["Reallocation_Status"] == "STRONG REALLOCATION CANDIDATE"]
+
+        # Bind the display formatters once instead of branching on every value
+        if anonymize:
+            lender_names = build_lender_anon_map(LENDERS)
+            fmt_score = round_score
+            fmt_pct = band_percentage
+            fmt_value = band_portfolio_total
+        else:
+            lender_names = {name: name for name in LENDERS}
+            fmt_score = _round1
+            fmt_pct = _round1
+            fmt_value = _fmt_millions
+
+        unalignes = int(df["Is_Unalign"].sum())
+        strong_candidates = int(
+            (df["Reallocation_Status"] == "STRONG REALLOCATION CANDIDATE").sum()
         )
-        moderate_candidates = len(
-            df[df["Reallocation_Status"] == "MODERATE REALLOCATION CANDIDATE"]
+        moderate_candidates = int(
+            (df["Reallocation_Status"] == "MODERATE REALLOCATION CANDIDATE").sum()
         )
 
         # Average fit scores
         avg_current_fit = df["Current_Lender_Fit"].mean()
         avg_best_fit = df["Best_Match_Fit"].mean()
 
-        # Lender analysis
+        # Lender analysis: count every lender's loans in one pass per column
+        # rather than scanning the whole frame once per lender
+        current_counts = df["Current_Lender"].value_counts()
+        best_match_counts = df["Best_Match_Lender"].value_counts()
         lender_stats = {}
         for lender_name in LENDERS.keys():
-            current_count = len(df[df["Current_Lender"] == lender_name])
-            best_match_count = len(df[df["Best_Match_Lender"] == lender_name])
-
-            # Anonymize lender name if requested
-            display_name = (
-                anonymize_lender(lender_name, is_current=False)
-                if anonymize
-                else lender_name
-            )
+            current_count = int(current_counts.get(lender_name, 0))
+            best_match_count = int(best_match_counts.get(lender_name, 0))
 
-            lender_stats[display_name] = {
+            lender_stats[lender_names[lender_name]] = {
                 "current_portfolio": current_count,
                 "optimal_portfolio": best_match_count,
                 "net_flow": best_match_count - current_count,
             }
 
         # Potential value if reallocated
-        candidates = df[df["Is_Unalign"] == True]
-        total_reallocation_value = candidates["Outstanding_Balance"].sum()
-
-        # Anonymize values if requested
-        if anonymize:
-            from utils.anonymizer import band_portfolio_total, band_percentage
-
-            value_display = band_portfolio_total(total_reallocation_value)
-            pct_display = band_percentage(unalignes / total * 100)
-            avg_imp_display = round_score(avg_best_fit - avg_current_fit)
-        else:
-            value_display = f"£{total_reallocation_value / 1e6:.1f}M"
-            pct_display = round(unalignes / total * 100, 1)
-            avg_imp_display = round(avg_best_fit - avg_current_fit, 1)
+        total_reallocation_value = df.loc[df["Is_Unalign"], "Outstanding_Balance"].sum()
 
         return {
             "total_companies": total,
-            "unaligned_companies": {"count": unalignes, "percentage": pct_display},
+            "unaligned_companies": {
+                "count": unalignes,
+                "percentage": fmt_pct(unalignes / total * 100),
+            },
             "reallocation_candidates": {
                 "strong": strong_candidates,
                 "moderate": moderate_candidates,
                 "total": strong_candidates + moderate_candidates,
             },
             "fit_scores": {
-                "average_current_fit": round_score(avg_current_fit)
-                if anonymize
-                else round(avg_current_fit, 1),
-                "average_optimal_fit": round_score(avg_best_fit)
-                if anonymize
-                else round(avg_best_fit, 1),
-                "average_improvement": avg_imp_display,
+                "average_current_fit": fmt_score(avg_current_fit),
+                "average_optimal_fit": fmt_score(avg_best_fit),
+                "average_improvement": fmt_score(avg_best_fit - avg_current_fit),
             },
             "lender_flows": lender_stats,
             "reallocation_value": {
                 "total_outstanding": round(total_reallocation_value, 2)
                 if not anonymize
                 else None,
-                "formatted": value_display,
+                "formatted": fmt_value(total_reallocation_value),
             },
         }
 
@@ -437,8 +482,8 @@ if __name__ == "__main__":
         print(f"{key}: {value}")
 
     print("\n=== Top 5 Reallocation Candidates ===")
-    candidates = matcher.get_reallocation_candidates(df, "STRONG")
-    for idx, row in candidates.head(5).iterrows():
+    candidates = matcher.get_reallocation_candidates(df, "STRONG", top_k=5)
+    for row in candidates.to_dict("records"):
         rec = matcher.get_reallocation_recommendation(row)
         print(f"\n{rec['company_id']} ({rec['sector']}, {rec['region']})")
         print(
@@ -26,6 +26,21 @@ class Pricer:
     RECOVERY_RATE = 0.40  # Average recovery rate on defaulted SME loans
     BASE_DISCOUNT_RATE = 0.05  # 5% annual discount rate
 
+    # Raw figures in get_pricing_details, hidden when anonymizing
+    RAW_DETAIL_COLUMNS = (
+        "Loan_Amount",
+        "Monthly_Payment",
+        "Interest_Rate",
+        "Remaining_Payments",
+        "Gross_Loan_Value",
+        "Expected_Loss",
+        "Risk_Adjusted_Value",
+        "Misfit_Discount",
+        "Gross_ROI",
+        "Risk_Adjusted_ROI",
+        "Default_Probability",
+    )
+
     def __init__(self):
         # Default probability mapping based on risk score
         self.default_prob_map = {
@@ -42,121 +57,129 @@ class Pricer:
         """
         Calculate pricing metrics for all companies.
 
+        Every column is computed as a whole-array expression and the results
+        are added with a single assign, rather than walking the rows once per
+        metric.
+
         Args:
             df: DataFrame with company data, risk scores, and fit scores
 
         Returns:
             DataFrame with added pricing columns
         """
+        out = {}
+        outstanding = df["Outstanding_Balance"].to_numpy(dtype=float)
+
         # Estimate default probability
-        df["Default_Probability"] = df["Risk_Score"].apply(
-            self._estimate_default_probability
+        out["Default_Probability"] = self._estimate_default_probability(
+            df["Risk_Score"].to_numpy(dtype=float)
         )
 
         # Calculate remaining payments
-        df["Remaining_Payments"] = df.apply(self._calculate_remaining_payments, axis=1)
+        out["Remaining_Payments"] = self._calculate_remaining_payments(
+            df["Monthly_Payment"].to_numpy(dtype=float),
+            df["Years_Remaining"].to_numpy(dtype=float),
+        )
 
         # Calculate gross loan value
-        df["Gross_Loan_Value"] = df["Remaining_Payments"]
+        out["Gross_Loan_Value"] = out["Remaining_Payments"]
 
         # Calculate risk-adjusted value
-        df["Expected_Loss"] = df.apply(
-            lambda row: row["Default_Probability"]
-            * (1 - self.RECOVERY_RATE)
-            * row["Outstanding_Balance"],
-            axis=1,
+        out["Expected_Loss"] = (
+            out["Default_Probability"] * (1 - self.RECOVERY_RATE) * outstanding
         )
-        df["Risk_Adjusted_Value"] = df["Gross_Loan_Value"] - df["Expected_Loss"]
+        out["Risk_Adjusted_Value"] = out["Gross_Loan_Value"] - out["Expected_Loss"]
 
         # Calculate misfit discount (seller motivation to exit)
-        df["Misfit_Discount"] = df["Current_Lender_Fit"].apply(
-            self._calculate_misfit_discount
+        out["Misfit_Discount"] = self._calculate_misfit_discount(
+            df["Current_Lender_Fit"].to_numpy(dtype=float)
         )
 
         # Calculate suggested price
-        df["Suggested_Price"] = df["Risk_Adjusted_Value"] * (1 - df["Misfit_Discount"])
+        out["Suggested_Price"] = out["Risk_Adjusted_Value"] * (1 - out["Misfit_Discount"])
 
         # Calculate discount from face value
-        df["Discount_Percent"] = (
-            1 - df["Suggested_Price"] / df["Outstanding_Balance"]
-        ) * 100
+        out["Discount_Percent"] = (1 - out["Suggested_Price"] / outstanding) * 100
 
         # Calculate buyer ROI metrics
-        roi_metrics = df.apply(self._calculate_buyer_roi, axis=1)
-        df["Gross_ROI"] = roi_metrics.apply(lambda x: x["gross_roi"])
-        df["Risk_Adjusted_ROI"] = roi_metrics.apply(lambda x: x["risk_adjusted_roi"])
-        df["Annualized_ROI"] = roi_metrics.apply(lambda x: x["annualized_roi"])
+        out.update(self._calculate_buyer_roi(
+            out["Suggested_Price"],
+            out["Remaining_Payments"],
+            out["Expected_Loss"],
+            df["Years_Remaining"].to_numpy(dtype=float),
+        ))
 
-        return df
+        return df.assign(**out)
 
-    def _estimate_default_probability(self, risk_score: float) -> float:
+    def _estimate_default_probability(self, risk_scores: np.ndarray) -> np.ndarray:
         """Estimate probability of default based on risk score."""
-        if pd.isna(risk_score):
-            return 0.05  # Default assumption
-
-        for (low, high), prob in self.default_prob_map.items():
-            if low <= risk_score < high:
-                return prob
-
-        return 0.05  # Fallback
+        # Missing or out-of-range scores fall through to the 5% assumption
+        return np.select(
+            [
+                (risk_scores >= low) & (risk_scores < high)
+                for low, high in self.default_prob_map
+            ],
+            list(self.default_prob_map.values()),
+            default=0.05,
+        )
 
-    def _calculate_remaining_payments(self, row: pd.Series) -> float:
+    def _calculate_remaining_payments(
+        self, monthly_payments: np.ndarray, years_remaining: np.ndarray
+    ) -> np.ndarray:
         """Calculate total remaining payments on the loan."""
-        monthly_payment = row.get("Monthly_Payment", 0)
-        years_remaining = row.get("Years_Remaining", 0)
         months_remaining = years_remaining * 12
 
-        return monthly_payment * months_remaining
+        return monthly_payments * months_remaining
 
-    def _calculate_misfit_discount(self, current_fit: float) -> float:
+    def _calculate_misfit_discount(self, current_fits: np.ndarray) -> np.ndarray:
         """
         Calculate discount based on how poorly the loan fits current lender.
         Lower fit = higher motivation to sell = larger discount accepted.
         """
-        if pd.isna(current_fit):
-            return 0.10  # Default 10% discount
-
-        if current_fit >= 70:
-            return 0.0  # Good fit, no discount needed
-        elif current_fit >= 60:
-            return 0.03  # 3% discount
-        elif current_fit >= 50:
-            return 0.07  # 7% discount
-        elif current_fit >= 40:
-            return 0.12  # 12% discount
-        elif current_fit >= 30:
-            return 0.18  # 18% discount
-        else:
-            return 0.25  # Max 25% discount for very poor fit
+        return np.select(
+            [
+                np.isnan(current_fits),  # Default 10% discount
+                current_fits >= 70,  # Good fit, no discount needed
+                current_fits >= 60,
+                current_fits >= 50,
+                current_fits >= 40,
+                current_fits >= 30,
+            ],
+            [0.10, 0.0, 0.03, 0.07, 0.12, 0.18],
+            default=0.25,  # Max 25% discount for very poor fit
+        )
 
-    def _calculate_buyer_roi(self, row: pd.Series) -> Dict:
+    def _calculate_buyer_roi(
+        self,
+        purchase_prices: np.ndarray,
+        remaining_payments: np.ndarray,
+        expected_losses: np.ndarray,
+        years_remaining: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
         """Calculate ROI metrics for a potential buyer."""
-        purchase_price = row.get("Suggested_Price", 0)
-        remaining_payments = row.get("Remaining_Payments", 0)
-        expected_loss = row.get("Expected_Loss", 0)
-        years_remaining = row.get("Years_Remaining", 1)
-
-        if purchase_price <= 0:
-            return {"gross_roi": 0, "risk_adjusted_roi": 0, "annualized_roi": 0}
+        # Loans with no positive price report zero for every ROI metric
+        priced = purchase_prices > 0
+        safe_prices = np.where(priced, purchase_prices, 1.0)
 
         # Gross ROI (before risk adjustment)
-        gross_profit = remaining_payments - purchase_price
-        gross_roi = gross_profit / purchase_price
+        gross_profit = remaining_payments - purchase_prices
+        gross_roi = gross_profit / safe_prices
 
         # Risk-adjusted ROI
-        risk_adjusted_profit = gross_profit - expected_loss
-        risk_adjusted_roi = risk_adjusted_profit / purchase_price
+        risk_adjusted_profit = gross_profit - expected_losses
+        risk_adjusted_roi = risk_adjusted_profit / safe_prices
 
         # Annualized ROI
-        if years_remaining > 0:
-            annualized_roi = risk_adjusted_roi / years_remaining
-        else:
-            annualized_roi = risk_adjusted_roi
+        annualized_roi = np.where(
+            years_remaining > 0,
+            risk_adjusted_roi / np.where(years_remaining > 0, years_remaining, 1.0),
+            risk_adjusted_roi,
+        )
 
         return {
-            "gross_roi": round(gross_roi * 100, 2),
-            "risk_adjusted_roi": round(risk_adjusted_roi * 100, 2),
-            "annualized_roi": round(annualized_roi * 100, 2),
+            "Gross_ROI": np.where(priced, np.round(gross_roi * 100, 2), 0),
+            "Risk_Adjusted_ROI": np.where(priced, np.round(risk_adjusted_roi * 100, 2), 0),
+            "Annualized_ROI": np.where(priced, np.round(annualized_roi * 100, 2), 0),
         }
 
     def get_pricing_details(
@@ -175,7 +198,10 @@ class Pricer:
         discount_pct = company.get("Discount_Percent", 0)
         roi = company.get("Annualized_ROI", 0)
 
+        # Branch on anonymize once: raw figures are read from `raw`, which
+        # holds None for each of them when anonymizing
         if anonymize:
+            raw = dict.fromkeys(self.RAW_DETAIL_COLUMNS)
             if for_table:
                 outstanding_display = band_loan_amount(outstanding)
                 price_display = band_loan_amount(suggested_price)
@@ -189,6 +215,7 @@ class Pricer:
             current_fit_display = round_score(company.get("Current_Lender_Fit", 0))
             best_fit_display = round_score(company.get("Best_Match_Fit", 0))
         else:
+            raw = {column: company.get(column, 0) for column in self.RAW_DETAIL_COLUMNS}
             outstanding_display = outstanding
             price_display = suggested_price
             discount_display = discount_pct
@@ -200,48 +227,28 @@ class Pricer:
         return {
             "company_id": company.get("SME_ID", "Unknown"),
             "loan_details": {
-                "original_amount": company.get("Loan_Amount", 0)
-                if not anonymize
-                else None,
+                "original_amount": raw["Loan_Amount"],
                 "outstanding_balance": outstanding_display,
                 "years_remaining": company.get("Years_Remaining", 0),
-                "monthly_payment": company.get("Monthly_Payment", 0)
-                if not anonymize
-                else None,
-                "interest_rate": company.get("Interest_Rate", 0)
-                if not anonymize
-                else None,
+                "monthly_payment": raw["Monthly_Payment"],
+                "interest_rate": raw["Interest_Rate"],
             },
             "valuation": {
-                "remaining_payments": company.get("Remaining_Payments", 0)
-                if not anonymize
-                else None,
-                "gross_value": company.get("Gross_Loan_Value", 0)
-                if not anonymize
-                else None,
-                "expected_loss": company.get("Expected_Loss", 0)
-                if not anonymize
-                else None,
-                "risk_adjusted_value": company.get("Risk_Adjusted_Value", 0)
-                if not anonymize
-                else None,
+                "remaining_payments": raw["Remaining_Payments"],
+                "gross_value": raw["Gross_Loan_Value"],
+                "expected_loss": raw["Expected_Loss"],
+                "risk_adjusted_value": raw["Risk_Adjusted_Value"],
             },
             "pricing": {
-                "misfit_discount": company.get("Misfit_Discount", 0)
-                if not anonymize
-                else None,
+                "misfit_discount": raw["Misfit_Discount"],
                 "suggested_price": price_display,
                 "discount_from_face": discount_display,
             },
             "buyer_metrics": {
-                "gross_roi": company.get("Gross_ROI", 0) if not anonymize else None,
-                "risk_adjusted_roi": company.get("Risk_Adjusted_ROI", 0)
-                if not anonymize
-                else None,
+                "gross_roi": raw["Gross_ROI"],
+                "risk_adjusted_roi": raw["Risk_Adjusted_ROI"],
                 "annualized_roi": roi_display,
-                "default_probability": company.get("Default_Probability", 0)
-                if not anonymize
-                else None,
+                "default_probability": raw["Default_Probability"],
             },
             "risk_context": {
                 "risk_score": risk_display,
@@ -337,16 +344,22 @@ class Pricer:
             df: DataFrame with pricing data
             anonymize: If True, band aggregate values
         """
-        # Only look at reallocation candidates
-        candidates = df[df["Is_Unalign"] == True]
+        # Only look at reallocation candidates; select just the columns used
+        # so the whole frame (fit reasons, flags, ...) is not copied
+        candidates = df.loc[
+            df["Is_Unalign"],
+            ["Outstanding_Balance", "Suggested_Price", "Discount_Percent", "Annualized_ROI"],
+        ]
+        discount = candidates["Discount_Percent"]
+        roi = candidates["Annualized_ROI"]
 
         if len(candidates) == 0:
             return {"message": "No reallocation candidates found"}
 
         total_outstanding = candidates["Outstanding_Balance"].sum()
         total_suggested = candidates["Suggested_Price"].sum()
-        avg_discount = candidates["Discount_Percent"].mean()
-        avg_roi = candidates["Annualized_ROI"].mean()
+        avg_discount = discount.mean()
+        avg_roi = roi.mean()
 
         if anonymize:
             outstanding_display = band_portfolio_total(total_outstanding)
@@ -368,42 +381,17 @@ class Pricer:
             "average_discount": discount_display,
             "average_buyer_roi": roi_display,
             "discount_distribution": {
-                "<5%": len(candidates[candidates["Discount_Percent"] < 5]),
-                "5-10%": len(
-                    candidates[
-                        (candidates["Discount_Percent"] >= 5)
-                        & (candidates["Discount_Percent"] < 10)
-                    ]
-                ),
-                "10-15%": len(
-                    candidates[
-                        (candidates["Discount_Percent"] >= 10)
-                        & (candidates["Discount_Percent"] < 15)
-                    ]
-                ),
-                "15-20%": len(
-                    candidates[
-                        (candidates["Discount_Percent"] >= 15)
-                        & (candidates["Discount_Percent"] < 20)
-                    ]
-                ),
-                ">20%": len(candidates[candidates["Discount_Percent"] >= 20]),
+                "<5%": int((discount < 5).sum()),
+                "5-10%": int(((discount >= 5) & (discount < 10)).sum()),
+                "10-15%": int(((discount >= 10) & (discount < 15)).sum()),
+                "15-20%": int(((discount >= 15) & (discount < 20)).sum()),
+                ">20%": int((discount >= 20).sum()),
             },
             "roi_distribution": {
-                "<5%": len(candidates[candidates["Annualized_ROI"] < 5]),
-                "5-10%": len(
-                    candidates[
-                        (candidates["Annualized_ROI"] >= 5)
-                        & (candidates["Annualized_ROI"] < 10)
-                    ]
-                ),
-                "10-15%": len(
-                    candidates[
-                        (candidates["Annualized_ROI"] >= 10)
-                        & (candidates["Annualized_ROI"] < 15)
-                    ]
-                ),
-                ">15%": len(candidates[candidates["Annualized_ROI"] >= 15]),
+                "<5%": int((roi < 5).sum()),
+                "5-10%": int(((roi >= 5) & (roi < 10)).sum()),
+                "10-15%": int(((roi >= 10) & (roi < 15)).sum()),
+                ">15%": int((roi >= 15).sum()),
             },
         }
 
@@ -441,7 +429,7 @@ if __name__ == "__main__":
 
     print("\n=== Sample Transaction ===")
     # Get a reallocation candidate
-    candidate = df[df["Is_Unalign"] == True].iloc[0]
+    candidate = df[df["Is_Unalign"]].iloc[0]
     summary = pricer.get_transaction_summary(candidate, "sale")
     for key, value in summary.items():
         print(f"{key}: {value}")
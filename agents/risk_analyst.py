@@ -5,7 +5,7 @@ Calculates financial health metrics and risk scores for each company.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 from utils.anonymizer import round_score
 
 
@@ -15,6 +15,27 @@ class RiskAnalyst:
     Uses rule-based scoring with financial ratios.
     """
 
+    # Overall and component score columns, in breakdown order
+    BREAKDOWN_SCORE_COLUMNS = (
+        'Risk_Score',
+        'Liquidity_Score',
+        'Profitability_Score',
+        'Leverage_Score',
+        'Cash_Score',
+        'Efficiency_Score',
+        'Size_Score',
+    )
+
+    # Raw ratio columns reported alongside each component, in breakdown order
+    BREAKDOWN_RATIO_COLUMNS = (
+        'Current_Ratio',
+        'Operating_Margin',
+        'Debt_Ratio',
+        'Cash_Ratio',
+        'Asset_Turnover',
+        'Working_Capital_Ratio',
+    )
+
     def __init__(self):
         # Weights for different risk components
         self.weights = {
@@ -36,36 +57,40 @@ class RiskAnalyst:
         Returns:
             DataFrame with added risk score columns
         """
-        # Calculate individual metrics
-        df = self._calculate_liquidity(df)
-        df = self._calculate_profitability(df)
-        df = self._calculate_leverage(df)
-        df = self._calculate_cash_position(df)
-        df = self._calculate_efficiency(df)
-        df = self._calculate_size_stability(df)
+        # Build every new column first and attach them in a single assign,
+        # rather than growing the frame one column at a time
+        out = {}
+        out.update(self._calculate_liquidity(df))
+        out.update(self._calculate_profitability(df))
+        out.update(self._calculate_leverage(df))
+        out.update(self._calculate_cash_position(df))
+        out.update(self._calculate_efficiency(df))
+        out.update(self._calculate_size_stability(df))
 
         # Calculate component scores (0-100)
-        df = self._calculate_component_scores(df)
+        out.update(self._calculate_component_scores(out, df.index))
 
         # Calculate overall risk score
-        df['Risk_Score'] = (
-            df['Liquidity_Score'] * self.weights['liquidity'] +
-            df['Profitability_Score'] * self.weights['profitability'] +
-            df['Leverage_Score'] * self.weights['leverage'] +
-            df['Cash_Score'] * self.weights['cash_position'] +
-            df['Efficiency_Score'] * self.weights['efficiency'] +
-            df['Size_Score'] * self.weights['size_stability']
+        out['Risk_Score'] = (
+            out['Liquidity_Score'] * self.weights['liquidity'] +
+            out['Profitability_Score'] * self.weights['profitability'] +
+            out['Leverage_Score'] * self.weights['leverage'] +
+            out['Cash_Score'] * self.weights['cash_position'] +
+            out['Efficiency_Score'] * self.weights['efficiency'] +
+            out['Size_Score'] * self.weights['size_stability']
         ).round(1)
 
-        # Add risk category
-        df['Risk_Category'] = df['Risk_Score'].apply(self._categorize_risk)
+        # Add risk category (categorical: only five distinct labels)
+        out['Risk_Category'] = pd.Categorical(self._categorize_risk(out['Risk_Score']))
 
-        return df
+        return df.assign(**out)
 
-    def _calculate_liquidity(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_liquidity(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         """Calculate liquidity ratios."""
+        out = {}
+
         # Current Ratio = Current Assets / Current Liabilities
-        df['Current_Ratio'] = np.where(
+        out['Current_Ratio'] = np.where(
             df['Total Current Liabilities'] > 0,
             df['Total Current Assets'] / df['Total Current Liabilities'],
             0
@@ -73,110 +98,120 @@ class RiskAnalyst:
 
         # Quick Ratio = (Current Assets - Stock) / Current Liabilities
         stock = df['Stock'].fillna(0)
-        df['Quick_Ratio'] = np.where(
+        out['Quick_Ratio'] = np.where(
             df['Total Current Liabilities'] > 0,
             (df['Total Current Assets'] - stock) / df['Total Current Liabilities'],
             0
         )
 
-        return df
+        return out
 
-    def _calculate_profitability(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_profitability(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         """Calculate profitability ratios."""
+        out = {}
+
         # Operating Margin = Operating Profit / Turnover
-        df['Operating_Margin'] = np.where(
+        out['Operating_Margin'] = np.where(
             df['Turnover'] > 0,
             df['Operating Profit'] / df['Turnover'],
             0
         )
 
         # EBITDA Margin
-        df['EBITDA_Margin'] = np.where(
+        out['EBITDA_Margin'] = np.where(
             df['Turnover'] > 0,
             df['EBITDA'] / df['Turnover'],
             0
         )
 
         # Gross Margin
-        df['Gross_Margin'] = np.where(
+        out['Gross_Margin'] = np.where(
             df['Turnover'] > 0,
             df['Gross Profit'] / df['Turnover'],
             0
         )
 
         # Return on Assets
-        df['ROA'] = np.where(
+        out['ROA'] = np.where(
             df['Total Assets'] > 0,
             df['Profit After Tax'] / df['Total Assets'],
             0
         )
 
-        return df
+        return out
 
-    def _calculate_leverage(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_leverage(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         """Calculate leverage ratios."""
+        out = {}
+
         # Debt Ratio = Total Liabilities / Total Assets
-        df['Debt_Ratio'] = np.where(
+        out['Debt_Ratio'] = np.where(
             df['Total Assets'] > 0,
             df['Total Liabilities'] / df['Total Assets'],
             1  # Assume high risk if no assets
         )
 
         # Debt to Equity = Total Liabilities / Net Assets
-        df['Debt_to_Equity'] = np.where(
+        out['Debt_to_Equity'] = np.where(
             df['Net Assets'] > 0,
             df['Total Liabilities'] / df['Net Assets'],
             10  # Cap at high value if negative equity
         )
 
-        return df
+        return out
 
-    def _calculate_cash_position(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_cash_position(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         """Calculate cash position metrics."""
+        out = {}
+
         # Cash Ratio = Cash / Current Liabilities
-        df['Cash_Ratio'] = np.where(
+        out['Cash_Ratio'] = np.where(
             df['Total Current Liabilities'] > 0,
             df['Cash'].fillna(0) / df['Total Current Liabilities'],
             0
         )
 
         # Cash to Assets
-        df['Cash_to_Assets'] = np.where(
+        out['Cash_to_Assets'] = np.where(
             df['Total Assets'] > 0,
             df['Cash'].fillna(0) / df['Total Assets'],
             0
         )
 
-        return df
+        return out
 
-    def _calculate_efficiency(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_efficiency(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         """Calculate efficiency metrics."""
+        out = {}
+
         # Asset Turnover = Turnover / Total Assets
-        df['Asset_Turnover'] = np.where(
+        out['Asset_Turnover'] = np.where(
             df['Total Assets'] > 0,
             df['Turnover'] / df['Total Assets'],
             0
         )
 
         # Revenue per Employee
-        df['Revenue_per_Employee'] = np.where(
+        out['Revenue_per_Employee'] = np.where(
             df['Number of Employees'] > 0,
             df['Turnover'] / df['Number of Employees'],
             0
         )
 
-        return df
+        return out
 
-    def _calculate_size_stability(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_size_stability(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         """Calculate size/stability indicators."""
+        out = {}
+
         # Working Capital ratio
-        df['Working_Capital_Ratio'] = np.where(
+        out['Working_Capital_Ratio'] = np.where(
             df['Total Current Liabilities'] > 0,
             df['Working Capital'] / df['Total Current Liabilities'],
             0
         )
 
-        return df
+        return out
 
     def _normalize(self, value: float, min_val: float, max_val: float, inverse: bool = False) -> float:
         """Normalize a value to 0-100 scale."""
@@ -198,86 +233,78 @@ class RiskAnalyst:
 
         return normalized * 100
 
-    def _calculate_component_scores(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate normalized component scores (0-100)."""
+    def _calculate_component_scores(self, metrics: Dict[str, np.ndarray], index: pd.Index) -> Dict[str, pd.Series]:
+        """
+        Calculate normalized component scores (0-100).
 
-        # Liquidity Score (higher is better)
-        # Good current ratio: 1.5-3.0
-        df['Liquidity_Score'] = df['Current_Ratio'].apply(
-            lambda x: self._normalize(x, 0.5, 3.0)
-        )
+        Args:
+            metrics: Ratio columns produced by the _calculate_* helpers
+            index: Index of the frame the scores will be attached to
 
-        # Profitability Score (higher margin is better)
-        # Good operating margin: 5-25%
-        df['Profitability_Score'] = df['Operating_Margin'].apply(
-            lambda x: self._normalize(x, -0.1, 0.25)
-        )
+        Returns:
+            Dictionary of score columns keyed by column name
+        """
+        def score(column: str, min_val: float, max_val: float, inverse: bool = False) -> pd.Series:
+            return pd.Series(metrics[column], index=index).apply(
+                lambda x: self._normalize(x, min_val, max_val, inverse)
+            )
 
-        # Leverage Score (lower debt is better - inverse)
-        # Good debt ratio: 0.2-0.6
-        df['Leverage_Score'] = df['Debt_Ratio'].apply(
-            lambda x: self._normalize(x, 0.2, 0.8, inverse=True)
-        )
+        return {
+            # Liquidity Score (higher is better)
+            # Good current ratio: 1.5-3.0
+            'Liquidity_Score': score('Current_Ratio', 0.5, 3.0),
 
-        # Cash Score (higher is better)
-        # Good cash ratio: 0.1-1.0
-        df['Cash_Score'] = df['Cash_Ratio'].apply(
-            lambda x: self._normalize(x, 0, 1.0)
-        )
+            # Profitability Score (higher margin is better)
+            # Good operating margin: 5-25%
+            'Profitability_Score': score('Operating_Margin', -0.1, 0.25),
 
-        # Efficiency Score (higher turnover is better)
-        # Good asset turnover: 0.5-2.5
-        df['Efficiency_Score'] = df['Asset_Turnover'].apply(
-            lambda x: self._normalize(x, 0.3, 2.5)
-        )
+            # Leverage Score (lower debt is better - inverse)
+            # Good debt ratio: 0.2-0.6
+            'Leverage_Score': score('Debt_Ratio', 0.2, 0.8, inverse=True),
 
-        # Size/Stability Score (positive working capital is better)
-        df['Size_Score'] = df['Working_Capital_Ratio'].apply(
-            lambda x: self._normalize(x, -0.5, 2.0)
-        )
+            # Cash Score (higher is better)
+            # Good cash ratio: 0.1-1.0
+            'Cash_Score': score('Cash_Ratio', 0, 1.0),
 
-        return df
-
-    def _categorize_risk(self, score: float) -> str:
-        """Categorize risk score into bands."""
-        if score >= 75:
-            return "Low Risk"
-        elif score >= 60:
-            return "Moderate-Low Risk"
-        elif score >= 45:
-            return "Moderate Risk"
-        elif score >= 30:
-            return "Moderate-High Risk"
-        else:
-            return "High Risk"
+            # Efficiency Score (higher turnover is better)
+            # Good asset turnover: 0.5-2.5
+            'Efficiency_Score': score('Asset_Turnover', 0.3, 2.5),
+
+            # Size/Stability Score (positive working capital is better)
+            'Size_Score': score('Working_Capital_Ratio', -0.5, 2.0),
+        }
 
-    def get_risk_breakdown(self, company: pd.Series, anonymize: bool = False) -> Dict:
+    def _categorize_risk(self, scores: pd.Series) -> np.ndarray:
+        """Categorize risk scores into bands."""
+        return np.select(
+            [scores >= 75, scores >= 60, scores >= 45, scores >= 30],
+            ["Low Risk", "Moderate-Low Risk", "Moderate Risk", "Moderate-High Risk"],
+            default="High Risk"
+        )
+
+    def get_risk_breakdown(self, company: Union[Dict, pd.Series], anonymize: bool = False) -> Dict:
         """
         Get detailed risk breakdown for a single company.
 
         Args:
-            company: Series with company data including risk scores
+            company: Record (dict or Series) with company data including risk scores.
+                For many companies, convert once with df.to_dict('records').
             anonymize: If True, round scores to nearest 5
 
         Returns:
             Dictionary with risk breakdown
         """
-        if anonymize:
-            overall = round_score(company.get('Risk_Score', 0))
-            liquidity = round_score(company.get('Liquidity_Score', 0))
-            profitability = round_score(company.get('Profitability_Score', 0))
-            leverage = round_score(company.get('Leverage_Score', 0))
-            cash = round_score(company.get('Cash_Score', 0))
-            efficiency = round_score(company.get('Efficiency_Score', 0))
-            stability = round_score(company.get('Size_Score', 0))
-        else:
-            overall = company.get('Risk_Score', 0)
-            liquidity = company.get('Liquidity_Score', 0)
-            profitability = company.get('Profitability_Score', 0)
-            leverage = company.get('Leverage_Score', 0)
-            cash = company.get('Cash_Score', 0)
-            efficiency = company.get('Efficiency_Score', 0)
-            stability = company.get('Size_Score', 0)
+        if not isinstance(company, dict):
+            company = company.to_dict()
+
+        # Read every score in one pass with the formatter chosen up front
+        fmt = round_score if anonymize else (lambda score: score)
+        overall, liquidity, profitability, leverage, cash, efficiency, stability = (
+            fmt(company.get(col, 0)) for col in self.BREAKDOWN_SCORE_COLUMNS
+        )
+        current_ratio, operating_margin, debt_ratio, cash_ratio, asset_turnover, wc_ratio = (
+            company.get(col, 0) for col in self.BREAKDOWN_RATIO_COLUMNS
+        )
 
         return {
             'overall_score': overall,
@@ -286,37 +313,37 @@ class RiskAnalyst:
                 'liquidity': {
                     'score': liquidity,
                     'weight': self.weights['liquidity'],
-                    'current_ratio': company.get('Current_Ratio', 0),
-                    'interpretation': self._interpret_liquidity(company.get('Current_Ratio', 0))
+                    'current_ratio': current_ratio,
+                    'interpretation': self._interpret_liquidity(current_ratio)
                 },
                 'profitability': {
                     'score': profitability,
                     'weight': self.weights['profitability'],
-                    'operating_margin': company.get('Operating_Margin', 0),
-                    'interpretation': self._interpret_profitability(company.get('Operating_Margin', 0))
+                    'operating_margin': operating_margin,
+                    'interpretation': self._interpret_profitability(operating_margin)
                 },
                 'leverage': {
                     'score': leverage,
                     'weight': self.weights['leverage'],
-                    'debt_ratio': company.get('Debt_Ratio', 0),
-                    'interpretation': self._interpret_leverage(company.get('Debt_Ratio', 0))
+                    'debt_ratio': debt_ratio,
+                    'interpretation': self._interpret_leverage(debt_ratio)
                 },
                 'cash_position': {
                     'score': cash,
                     'weight': self.weights['cash_position'],
-                    'cash_ratio': company.get('Cash_Ratio', 0),
-                    'interpretation': self._interpret_cash(company.get('Cash_Ratio', 0))
+                    'cash_ratio': cash_ratio,
+                    'interpretation': self._interpret_cash(cash_ratio)
                 },
                 'efficiency': {
                     'score': efficiency,
                     'weight': self.weights['efficiency'],
-                    'asset_turnover': company.get('Asset_Turnover', 0),
-                    'interpretation': self._interpret_efficiency(company.get('Asset_Turnover', 0))
+                    'asset_turnover': asset_turnover,
+                    'interpretation': self._interpret_efficiency(asset_turnover)
                 },
                 'stability': {
                     'score': stability,
                     'weight': self.weights['size_stability'],
-                    'working_capital_ratio': company.get('Working_Capital_Ratio', 0)
+                    'working_capital_ratio': wc_ratio
                 }
             }
         }
@@ -391,7 +418,7 @@ if __name__ == "__main__":
     print(df['Risk_Category'].value_counts())
 
     print("\n=== Sample Risk Breakdown ===")
-    sample = df.iloc[0]
+    sample = df.iloc[0].to_dict()
     breakdown = analyst.get_risk_breakdown(sample)
     print(f"Company: {sample['SME_ID']}")
     print(f"Overall Score: {breakdown['overall_score']}")
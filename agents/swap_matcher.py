@@ -8,9 +8,12 @@ A swap is complementary when:
 - Both loans are unalignes for current holders
 """
 
+import heapq
+from operator import itemgetter
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional, Tuple
-from utils.anonymizer import round_score, band_loan_amount
+from utils.anonymizer import round_score, band_loan_amounts
 
 
 class SwapMatcher:
@@ -33,7 +36,9 @@ class SwapMatcher:
         self.min_fit_improvement = min_fit_improvement
         self.value_tolerance = value_tolerance
 
-    def find_complementary_swaps(self, df: pd.DataFrame) -> List[Dict]:
+    def find_complementary_swaps(
+        self, df: pd.DataFrame, top_k: Optional[int] = None
+    ) -> List[Dict]:
         """
         Find all complementary swap pairs ranked by score.
 
@@ -45,97 +50,157 @@ class SwapMatcher:
                 - Outstanding_Balance
                 - Inclusion_Score
                 - Inclusion_Flags
+            top_k: If set, only return the top_k highest-scoring swaps
 
         Returns:
             List of swap records sorted by swap_score (descending)
         """
-        swaps = []
-        seen_pairs = set()  # Track (loan_a, loan_b) pairs to avoid duplicates
-
-        # Get list of unique lenders
-        lenders = df["Current_Lender"].unique()
-
-        for lender_A in lenders:
-            # Find loans that lender A holds that are unaligned
-            a_unaligned = df[
-                (df["Current_Lender"] == lender_A)
-                & (df["Fit_Gap"] >= self.min_fit_improvement)
-            ]
-
-            for _, loan_X in a_unaligned.iterrows():
-                lender_B = loan_X["Best_Match_Lender"]
-
-                # Skip if lender_B is the same as lender_A
-                if lender_B == lender_A:
-                    continue
-
-                # Find complementary: loans B holds that fit A better
-                b_to_a = df[
-                    (df["Current_Lender"] == lender_B)
-                    & (df["Best_Match_Lender"] == lender_A)
-                    & (df["Fit_Gap"] >= self.min_fit_improvement)
-                ]
-
-                for _, loan_Y in b_to_a.iterrows():
-                    # Create a canonical pair ID to avoid duplicates
-                    pair_id = tuple(sorted([loan_X["SME_ID"], loan_Y["SME_ID"]]))
-                    if pair_id in seen_pairs:
-                        continue
-                    seen_pairs.add(pair_id)
-
-                    # Check value compatibility
-                    if self._check_value_compatibility(loan_X, loan_Y):
-                        swap = self._create_swap_record(
-                            loan_X, loan_Y, lender_A, lender_B
-                        )
-                        swaps.append(swap)
-
-        # Sort by swap_score descending
-        return sorted(swaps, key=lambda x: x["swap_score"], reverse=True)
-
-    def find_swaps_for_lender(self, df: pd.DataFrame, lender: str) -> List[Dict]:
+        df = self._add_inclusion_bonus_columns(df)
+
+        # Get list of unique lenders; their order decides which side of a
+        # pair is reported as lender A
+        lenders = pd.unique(df["Current_Lender"].dropna().to_numpy())
+
+        unaligned = df[df["Fit_Gap"] >= self.min_fit_improvement]
+        # Band each loan once here rather than once per swap it appears in
+        unaligned = unaligned.assign(
+            Outstanding_Band=band_loan_amounts(unaligned["Outstanding_Balance"])
+        )
+        # Rows are plain dict records: cheaper to read than the Series
+        # objects iterrows() builds for every row
+        records = unaligned.to_dict("records")
+
+        # One row per unaligned loan that fits another lender better. Lenders
+        # are encoded as integer codes over `lenders`, so a lender's code is
+        # also its rank and every comparison below is an integer compare.
+        # A best match that no loan is currently held by gets -1 and can
+        # never be paired.
+        candidates = pd.DataFrame({
+            "pos": np.arange(len(unaligned)),
+            "rank": pd.Categorical(unaligned["Current_Lender"], categories=lenders).codes,
+            "best": pd.Categorical(unaligned["Best_Match_Lender"], categories=lenders).codes,
+            "value": unaligned["Outstanding_Balance"].to_numpy(dtype=float),
+        })
+        candidates = candidates[
+            (candidates["rank"] >= 0)
+            & (candidates["best"] >= 0)
+            & (candidates["rank"] != candidates["best"])
+        ]
+
+        # Pair Loan X (A -> B) with every Loan Y (B -> A) in a single join
+        pairs = candidates.merge(
+            candidates,
+            left_on=["best", "rank"],
+            right_on=["rank", "best"],
+            suffixes=("_x", "_y"),
+        )
+        # Each pair is found from both sides; keep it from the side of the
+        # lender that comes first, as the lender-by-lender scan did
+        pairs = pairs[pairs["rank_x"] < pairs["rank_y"]]
+        pairs = pairs[self._check_value_compatibility(
+            pairs["value_x"].to_numpy(), pairs["value_y"].to_numpy()
+        )]
+        pairs = pairs.sort_values(["rank_x", "pos_x", "pos_y"])
+
+        swaps = [
+            self._create_swap_record(
+                records[x], records[y],
+                records[x]["Current_Lender"], records[x]["Best_Match_Lender"]
+            )
+            for x, y in zip(pairs["pos_x"], pairs["pos_y"])
+        ]
+
+        return self._rank_swaps(swaps, top_k)
+
+    def find_swaps_for_lender(
+        self, df: pd.DataFrame, lender: str, top_k: Optional[int] = None
+    ) -> List[Dict]:
         """
         Find swap opportunities relevant to a specific lender.
 
         Args:
             df: DataFrame with company/loan data
             lender: The lender to find swaps for
+            top_k: If set, only return the top_k highest-scoring swaps
 
         Returns:
             List of swap records where this lender is involved
         """
-        all_swaps = self.find_complementary_swaps(df)
-        return [
-            s for s in all_swaps if s["lender_a"] == lender or s["lender_b"] == lender
-        ]
+        return self.find_swaps_by_lender(df, top_k).get(lender, [])
 
-    def _check_value_compatibility(self, loan_a: pd.Series, loan_b: pd.Series) -> bool:
+    def find_swaps_by_lender(
+        self, df: pd.DataFrame, top_k: Optional[int] = None
+    ) -> Dict[str, List[Dict]]:
         """
-        Check if two loans have compatible values for a swap.
+        Find swap opportunities for every lender in one pass.
+
+        Swaps are enumerated and ranked once, then indexed by both parties,
+        so looking up any lender's swaps is a dict hit rather than a scan.
 
         Args:
-            loan_a: First loan
-            loan_b: Second loan
+            df: DataFrame with company/loan data
+            top_k: If set, keep only each lender's top_k highest-scoring swaps
 
         Returns:
-            True if loans are within value tolerance of each other
+            Mapping of lender name to its swap records, sorted by swap_score
+            (descending)
         """
-        val_a = loan_a.get("Outstanding_Balance", 0)
-        val_b = loan_b.get("Outstanding_Balance", 0)
+        swaps_by_lender: Dict[str, List[Dict]] = {}
+        for swap in self.find_complementary_swaps(df):
+            swaps_by_lender.setdefault(swap["lender_a"], []).append(swap)
+            swaps_by_lender.setdefault(swap["lender_b"], []).append(swap)
+
+        if top_k is not None:
+            swaps_by_lender = {
+                lender: swaps[:top_k] for lender, swaps in swaps_by_lender.items()
+            }
+        return swaps_by_lender
 
-        if val_a <= 0 or val_b <= 0:
-            return False
+    def _rank_swaps(self, swaps: List[Dict], top_k: Optional[int] = None) -> List[Dict]:
+        """
+        Order swaps by swap_score (descending).
 
-        value_ratio = val_a / val_b
+        When only the best few are needed, a bounded heap avoids sorting
+        the whole list (O(N log K) instead of O(N log N)).
+
+        Args:
+            swaps: Swap records to rank
+            top_k: If set, only return the top_k highest-scoring swaps
+
+        Returns:
+            Ranked list of swap records
+        """
+        if top_k is not None:
+            return heapq.nlargest(top_k, swaps, key=itemgetter("swap_score"))
+        return sorted(swaps, key=itemgetter("swap_score"), reverse=True)
+
+    def _check_value_compatibility(
+        self, val_a: np.ndarray, val_b: np.ndarray
+    ) -> np.ndarray:
+        """
+        Check which loan pairs have compatible values for a swap.
+
+        Args:
+            val_a: Outstanding balances of the first loan in each pair
+            val_b: Outstanding balances of the second loan in each pair
+
+        Returns:
+            Boolean mask, True where loans are within value tolerance of each other
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value_ratio = val_a / val_b
 
         # Check if within tolerance (e.g., 0.83 to 1.20 for 20% tolerance)
         min_ratio = 1 / (1 + self.value_tolerance)
         max_ratio = 1 + self.value_tolerance
 
-        return min_ratio <= value_ratio <= max_ratio
+        return (
+            (val_a > 0) & (val_b > 0)
+            & (min_ratio <= value_ratio) & (value_ratio <= max_ratio)
+        )
 
     def _create_swap_record(
-        self, loan_a: pd.Series, loan_b: pd.Series, lender_a: str, lender_b: str
+        self, loan_a: Dict, loan_b: Dict, lender_a: str, lender_b: str
     ) -> Dict:
         """
         Create a swap record from two complementary loans.
@@ -174,7 +239,7 @@ class SwapMatcher:
             "loan_a_sector": loan_a.get("Sector", "Unknown"),
             "loan_a_region": loan_a.get("Region", "Unknown"),
             "loan_a_outstanding": val_a,
-            "loan_a_outstanding_band": band_loan_amount(val_a),
+            "loan_a_outstanding_band": loan_a["Outstanding_Band"],
             "loan_a_current_fit": loan_a.get("Current_Lender_Fit", 0),
             "loan_a_new_fit": loan_a.get("Best_Match_Fit", 0),
             "loan_a_fit_gap": fit_improvement_a,
@@ -185,7 +250,7 @@ class SwapMatcher:
             "loan_b_sector": loan_b.get("Sector", "Unknown"),
             "loan_b_region": loan_b.get("Region", "Unknown"),
             "loan_b_outstanding": val_b,
-            "loan_b_outstanding_band": band_loan_amount(val_b),
+            "loan_b_outstanding_band": loan_b["Outstanding_Band"],
             "loan_b_current_fit": loan_b.get("Current_Lender_Fit", 0),
             "loan_b_new_fit": loan_b.get("Best_Match_Fit", 0),
             "loan_b_fit_gap": fit_improvement_b,
@@ -202,7 +267,46 @@ class SwapMatcher:
             "needs_cash_adjustment": value_diff_pct > 5,  # Flag if >5% difference
         }
 
-    def _calculate_inclusion_bonus(self, loan_a: pd.Series, loan_b: pd.Series) -> float:
+    def _add_inclusion_bonus_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Materialize the per-loan inclusion bonus inputs once per search.
+
+        Adds int8 columns High_Inclusion (Inclusion_Score >= 60) and
+        Has_Strong_Overlooked ("Strong but Overlooked" in Inclusion_Flags) so
+        the pair loop reads flags instead of re-parsing them for every pair.
+
+        Args:
+            df: DataFrame with Inclusion_Score and Inclusion_Flags
+
+        Returns:
+            DataFrame with the bonus columns added (unchanged if already present)
+        """
+        if "High_Inclusion" in df.columns and "Has_Strong_Overlooked" in df.columns:
+            return df
+
+        if "Inclusion_Score" in df.columns:
+            high_inclusion = (df["Inclusion_Score"].fillna(0) >= 60).astype("int8")
+        else:
+            high_inclusion = 0
+
+        if "Inclusion_Flags" in df.columns:
+            # Flags are a list from InclusionScanner, or a string once serialized
+            strong_overlooked = (
+                df["Inclusion_Flags"]
+                .apply(
+                    lambda flags: isinstance(flags, (list, str))
+                    and "Strong but Overlooked" in flags
+                )
+                .astype("int8")
+            )
+        else:
+            strong_overlooked = 0
+
+        return df.assign(
+            High_Inclusion=high_inclusion, Has_Strong_Overlooked=strong_overlooked
+        )
+
+    def _calculate_inclusion_bonus(self, loan_a: Dict, loan_b: Dict) -> float:
         """
         Calculate inclusion bonus for the swap.
 
@@ -211,28 +315,18 @@ class SwapMatcher:
         - +5 points for each loan flagged as "Strong but Overlooked"
 
         Args:
-            loan_a: First loan
-            loan_b: Second loan
+            loan_a: First loan (with columns from _add_inclusion_bonus_columns)
+            loan_b: Second loan (with columns from _add_inclusion_bonus_columns)
 
         Returns:
             Total inclusion bonus
         """
-        bonus = 0
-
-        for loan in [loan_a, loan_b]:
-            # High inclusion score bonus
-            inclusion_score = loan.get("Inclusion_Score", 0)
-            if inclusion_score >= 60:
-                bonus += 10
-
-            # Strong but overlooked bonus
-            flags = loan.get("Inclusion_Flags", [])
-            if isinstance(flags, list) and "Strong but Overlooked" in flags:
-                bonus += 5
-            elif isinstance(flags, str) and "Strong but Overlooked" in flags:
-                bonus += 5
-
-        return bonus
+        return int(
+            10 * loan_a["High_Inclusion"]
+            + 10 * loan_b["High_Inclusion"]
+            + 5 * loan_a["Has_Strong_Overlooked"]
+            + 5 * loan_b["Has_Strong_Overlooked"]
+        )
 
     def get_swap_summary(self, swap: Dict, for_lender: str) -> Dict:
         """
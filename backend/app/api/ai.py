@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func
 from typing import Optional
+from functools import lru_cache
 import os
 
 from ..core.database import get_db
@@ -16,9 +18,13 @@ from ..schemas.ai import (
     CompanyInsightRequest,
     CompanyInsightResponse,
 )
+from ..services.cache import get_cached_aggregate
 
 router = APIRouter()
 
+CurrentLender = aliased(Lender)
+BestMatchLender = aliased(Lender)
+
 # Try to import Gemini
 try:
     import google.generativeai as genai
@@ -32,15 +38,28 @@ except ImportError:
     GEMINI_AVAILABLE = False
 
 
+@lru_cache(maxsize=1)
+def get_gemini_model():
+    """Shared Gemini model client, created on first use"""
+    return genai.GenerativeModel("gemini-pro")
+
+
+# Generated text keyed by prompt, so a repeated request is answered once.
+# Most prompts come from static loan and company data, but the market
+# insight prompt embeds the caller's free-form focus_area, so the cache is a
+# bounded LRU. Failed calls raise and are therefore not stored.
+@lru_cache(maxsize=256)
+def _generate_cached(prompt: str) -> str:
+    return get_gemini_model().generate_content(prompt).text
+
+
 def generate_with_gemini(prompt: str) -> str:
     """Generate text using Gemini API"""
     if not GEMINI_AVAILABLE:
         return None
 
     try:
-        model = genai.GenerativeModel("gemini-pro")
-        response = model.generate_content(prompt)
-        return response.text
+        return _generate_cached(prompt)
     except Exception as e:
         print(f"Gemini error: {e}")
         return None
@@ -85,21 +104,48 @@ async def generate_explanation(
     request: ExplanationRequest, db: Session = Depends(get_db)
 ):
     """Generate AI explanation for why a loan is a good match"""
-    loan = db.query(Loan).filter(Loan.id == request.loan_id).first()
-    if not loan:
+    # Loan data is static between reloads, so the lookups and text building
+    # happen once per loan; Gemini output is memoized separately by prompt
+    texts = get_cached_aggregate(
+        f"ai_explanation:{request.loan_id}",
+        lambda: _build_explanation_texts(db, request.loan_id),
+    )
+    if texts is None:
         raise HTTPException(status_code=404, detail="Loan not found")
+    prompt, template = texts
 
-    company = db.query(Company).filter(Company.id == loan.company_id).first()
-    current_lender = (
-        db.query(Lender).filter(Lender.id == loan.current_lender_id).first()
+    # Try Gemini first
+    if prompt:
+        explanation = generate_with_gemini(prompt)
+        if explanation:
+            return ExplanationResponse(
+                loan_id=request.loan_id, explanation=explanation, generated_by="gemini"
+            )
+
+    # Fallback to template
+    return ExplanationResponse(
+        loan_id=request.loan_id, explanation=template, generated_by="template"
     )
-    best_lender = (
-        db.query(Lender).filter(Lender.id == loan.best_match_lender_id).first()
-        if loan.best_match_lender_id
-        else None
+
+
+def _build_explanation_texts(
+    db: Session, loan_id: int
+) -> Optional[tuple[Optional[str], str]]:
+    """Build the Gemini prompt (if enabled) and template explanation for a loan"""
+    # Loan, company and both lenders in one joined query
+    row = (
+        db.query(Loan, Company, CurrentLender, BestMatchLender)
+        .outerjoin(Company, Company.id == Loan.company_id)
+        .outerjoin(CurrentLender, CurrentLender.id == Loan.current_lender_id)
+        .outerjoin(BestMatchLender, BestMatchLender.id == Loan.best_match_lender_id)
+        .filter(Loan.id == loan_id)
+        .first()
     )
+    if not row:
+        return None
+    loan, company, current_lender, best_lender = row
 
-    # Try Gemini first
+    prompt = None
     if GEMINI_AVAILABLE:
         prompt = f"""Generate a concise 2-3 sentence explanation for why this SME loan reallocation makes sense:
 
@@ -118,19 +164,10 @@ Recommended Lender Focus: {best_lender.description if best_lender else "N/A"}
 
 Explain why this reallocation benefits both parties and the SME. Focus on risk alignment, sector expertise, and inclusion impact."""
 
-        explanation = generate_with_gemini(prompt)
-        if explanation:
-            return ExplanationResponse(
-                loan_id=request.loan_id, explanation=explanation, generated_by="gemini"
-            )
-
-    # Fallback to template
-    explanation = generate_loan_explanation_template(
+    template = generate_loan_explanation_template(
         loan, company, current_lender, best_lender
     )
-    return ExplanationResponse(
-        loan_id=request.loan_id, explanation=explanation, generated_by="template"
-    )
+    return prompt, template
 
 
 @router.post("/market-insight", response_model=MarketInsightResponse)
@@ -138,14 +175,9 @@ async def generate_market_insight(
     request: MarketInsightRequest, db: Session = Depends(get_db)
 ):
     """Generate AI market insight"""
-    # Gather market stats
-    from sqlalchemy import func
-
-    total_companies = db.query(Company).count()
-    unaligned_loans = db.query(Loan).filter(Loan.is_unalign == True).count()
-    high_inclusion = db.query(Company).filter(Company.inclusion_score >= 60).count()
-    avg_fit_gap = (
-        db.query(func.avg(Loan.fit_gap)).filter(Loan.is_unalign == True).scalar() or 0
+    # Gather market stats (static between data reloads, so computed once)
+    total_companies, unaligned_loans, high_inclusion, avg_fit_gap = (
+        get_cached_aggregate("ai_market_stats", lambda: _gather_market_stats(db))
     )
 
     if GEMINI_AVAILABLE:
@@ -169,17 +201,32 @@ Be specific about opportunities and actionable insights."""
     return MarketInsightResponse(insight=insight, generated_by="template")
 
 
+def _gather_market_stats(db: Session) -> tuple:
+    total_companies = db.query(Company).count()
+    unaligned_loans = db.query(Loan).filter(Loan.is_unalign == True).count()
+    high_inclusion = db.query(Company).filter(Company.inclusion_score >= 60).count()
+    avg_fit_gap = (
+        db.query(func.avg(Loan.fit_gap)).filter(Loan.is_unalign == True).scalar() or 0
+    )
+    return total_companies, unaligned_loans, high_inclusion, avg_fit_gap
+
+
 @router.post("/swap-story", response_model=SwapStoryResponse)
 async def generate_swap_story(request: SwapStoryRequest, db: Session = Depends(get_db)):
     """Generate AI inclusion story for a swap"""
-    loan1 = db.query(Loan).filter(Loan.id == request.loan1_id).first()
-    loan2 = db.query(Loan).filter(Loan.id == request.loan2_id).first()
+    # Both loans' companies in one round trip
+    companies = dict(
+        db.query(Loan.id, Company)
+        .outerjoin(Company, Company.id == Loan.company_id)
+        .filter(Loan.id.in_([request.loan1_id, request.loan2_id]))
+        .all()
+    )
 
-    if not loan1 or not loan2:
+    if request.loan1_id not in companies or request.loan2_id not in companies:
         raise HTTPException(status_code=404, detail="One or both loans not found")
 
-    company1 = db.query(Company).filter(Company.id == loan1.company_id).first()
-    company2 = db.query(Company).filter(Company.id == loan2.company_id).first()
+    company1 = companies[request.loan1_id]
+    company2 = companies[request.loan2_id]
 
     if GEMINI_AVAILABLE:
         prompt = f"""Generate an inspiring 2-3 sentence story about how this loan swap promotes financial inclusion:
@@ -207,11 +254,15 @@ async def generate_company_insight(
     request: CompanyInsightRequest, db: Session = Depends(get_db)
 ):
     """Generate AI insight for a specific company"""
-    company = db.query(Company).filter(Company.id == request.company_id).first()
-    if not company:
+    row = (
+        db.query(Company, Loan)
+        .outerjoin(Loan, Loan.company_id == Company.id)
+        .filter(Company.id == request.company_id)
+        .first()
+    )
+    if not row:
         raise HTTPException(status_code=404, detail="Company not found")
-
-    loan = db.query(Loan).filter(Loan.company_id == company.id).first()
+    company, loan = row
 
     if GEMINI_AVAILABLE:
         risk_str = f"{company.risk_score:.0f}" if company.risk_score else "N/A"
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
 
 from ..core.database import get_db
 from ..models import Company, Loan, Lender
@@ -8,23 +8,29 @@ from ..services.anonymizer import anonymize_lender, band_turnover
 
 router = APIRouter()
 
+CurrentLender = aliased(Lender)
+BestMatchLender = aliased(Lender)
 
-@router.get("/{company_id}", response_model=CompanyDetail)
-async def get_company(company_id: int, db: Session = Depends(get_db)):
-    """Get company details by ID"""
-    company = db.query(Company).filter(Company.id == company_id).first()
-    if not company:
+
+def _load_company(db: Session, company_id: int):
+    """Fetch a company with its loan and both lenders in one joined query"""
+    row = (
+        db.query(Company, Loan, CurrentLender, BestMatchLender)
+        .outerjoin(Loan, Loan.company_id == Company.id)
+        .outerjoin(CurrentLender, CurrentLender.id == Loan.current_lender_id)
+        .outerjoin(BestMatchLender, BestMatchLender.id == Loan.best_match_lender_id)
+        .filter(Company.id == company_id)
+        .first()
+    )
+    if not row:
         raise HTTPException(status_code=404, detail="Company not found")
+    return row
 
-    # Get associated loan
-    loan = db.query(Loan).filter(Loan.company_id == company_id).first()
-    current_lender = None
-    best_match_lender = None
 
-    if loan:
-        current_lender = db.query(Lender).filter(Lender.id == loan.current_lender_id).first()
-        if loan.best_match_lender_id:
-            best_match_lender = db.query(Lender).filter(Lender.id == loan.best_match_lender_id).first()
+@router.get("/{company_id}", response_model=CompanyDetail)
+async def get_company(company_id: int, db: Session = Depends(get_db)):
+    """Get company details by ID"""
+    company, loan, current_lender, best_match_lender = _load_company(db, company_id)
 
     return CompanyDetail(
         id=company.id,
@@ -64,20 +70,10 @@ async def get_company(company_id: int, db: Session = Depends(get_db)):
 @router.get("/{company_id}/analysis", response_model=CompanyAnalysis)
 async def get_company_analysis(company_id: int, db: Session = Depends(get_db)):
     """Get full analysis for a company including loan details"""
-    company = db.query(Company).filter(Company.id == company_id).first()
-    if not company:
-        raise HTTPException(status_code=404, detail="Company not found")
-
-    loan = db.query(Loan).filter(Loan.company_id == company_id).first()
-    current_lender = None
-    best_match_lender = None
+    company, loan, current_lender, best_match_lender = _load_company(db, company_id)
 
     loan_summary = None
     if loan:
-        current_lender = db.query(Lender).filter(Lender.id == loan.current_lender_id).first()
-        if loan.best_match_lender_id:
-            best_match_lender = db.query(Lender).filter(Lender.id == loan.best_match_lender_id).first()
-
         loan_summary = LoanSummary(
             id=loan.id,
             loan_amount=loan.loan_amount,
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, update
+from sqlalchemy.dialects.sqlite import insert
+from typing import Optional
 
 from ..core.database import get_db
 from ..core.config import settings
-from ..models import CreditTransaction
+from ..models import CreditTransaction, Lender
 from ..schemas.credits import (
     CreditBalance,
     SpendRequest,
@@ -12,6 +14,7 @@ from ..schemas.credits import (
     CreditHistory,
     CreditCosts,
 )
+from ..services.cache import get_lender_names
 
 router = APIRouter()
 
@@ -30,39 +33,81 @@ CREDIT_COSTS = {
     "propose_swap": 5,
 }
 
+# The cost table is static, so build the response model once at import
+CREDIT_COSTS_RESPONSE = CreditCosts(costs=CREDIT_COSTS)
 
-def get_current_balance(db: Session, lender_id: int) -> int:
-    """Get current credit balance for a lender"""
-    last_transaction = (
-        db.query(CreditTransaction)
+
+def _latest_transaction_balance(db: Session, lender_id: int):
+    """Scalar subquery for the balance after the lender's latest transaction"""
+    return (
+        db.query(CreditTransaction.balance_after)
         .filter(CreditTransaction.lender_id == lender_id)
         .order_by(CreditTransaction.timestamp.desc())
-        .first()
+        .limit(1)
+        .correlate(None)
+        .scalar_subquery()
     )
-    if last_transaction:
-        return last_transaction.balance_after
+
+
+def _balance_expression(db: Session, lender_id: int):
+    """Running balance from the lender row, else the latest transaction"""
+    running_balance = (
+        db.query(Lender.credit_balance)
+        .filter(Lender.id == lender_id)
+        .correlate(None)
+        .scalar_subquery()
+    )
+    return func.coalesce(running_balance, _latest_transaction_balance(db, lender_id))
+
+
+def get_current_balance(db: Session, lender_id: int) -> int:
+    """Get current credit balance for a lender"""
+    balance = db.query(_balance_expression(db, lender_id)).scalar()
+    if balance is not None:
+        return balance
     return settings.INITIAL_CREDITS
 
 
+def _debit_balance(
+    db: Session, lender_id: int, cost: int, current_balance: int
+) -> Optional[int]:
+    """Take cost off the lender's running balance in one conditional UPDATE.
+
+    Returns the new balance, or None if the balance no longer covers the
+    cost (e.g. a concurrent spend got there first).
+    """
+    # First spend since the lender row was created: seed it from history
+    db.execute(
+        update(Lender)
+        .where(Lender.id == lender_id, Lender.credit_balance.is_(None))
+        .values(credit_balance=current_balance)
+    )
+    return db.execute(
+        update(Lender)
+        .where(Lender.id == lender_id, Lender.credit_balance >= cost)
+        .values(credit_balance=Lender.credit_balance - cost)
+        .returning(Lender.credit_balance)
+    ).scalar_one_or_none()
+
+
 @router.get("/balance", response_model=CreditBalance)
 async def get_balance(
     lender_id: int = Query(..., description="Lender ID"),
     db: Session = Depends(get_db)
 ):
     """Get current credit balance"""
-    balance = get_current_balance(db, lender_id)
-
-    # Get spending stats
-    total_spent = (
-        db.query(func.sum(CreditTransaction.cost))
-        .filter(CreditTransaction.lender_id == lender_id)
-        .scalar() or 0
-    )
-    action_count = (
-        db.query(CreditTransaction)
+    # Balance, total spent and action count in one round trip
+    balance, total_spent, action_count = (
+        db.query(
+            _balance_expression(db, lender_id),
+            func.coalesce(func.sum(CreditTransaction.cost), 0),
+            func.count(CreditTransaction.id),
+        )
         .filter(CreditTransaction.lender_id == lender_id)
-        .count()
+        .one()
     )
+    if balance is None:
+        balance = settings.INITIAL_CREDITS
 
     return CreditBalance(
         balance=balance,
@@ -82,6 +127,10 @@ async def spend_credits(
     if cost is None:
         raise HTTPException(status_code=400, detail=f"Unknown action type: {request.action_type}")
 
+    # Credits are tracked on the lender row, so the lender must exist
+    if request.lender_id not in get_lender_names(db):
+        raise HTTPException(status_code=404, detail="Lender not found")
+
     # Check balance
     current_balance = get_current_balance(db, request.lender_id)
     if current_balance < cost:
@@ -90,37 +139,43 @@ async def spend_credits(
             detail=f"Insufficient credits. Need {cost}, have {current_balance}"
         )
 
-    # Check if already viewed (prevent double charging)
-    if request.target_id:
-        existing = (
-            db.query(CreditTransaction)
-            .filter(
-                CreditTransaction.lender_id == request.lender_id,
-                CreditTransaction.action_type == request.action_type,
-                CreditTransaction.target_id == request.target_id,
-            )
-            .first()
+    # Charge the running balance, then record the transaction against it
+    new_balance = _debit_balance(db, request.lender_id, cost, current_balance)
+    if new_balance is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=402,
+            detail=f"Insufficient credits. Need {cost}, have {current_balance}"
+        )
+
+    # A repeat of a targeted action hits the unique index instead of being
+    # looked up first (prevents double charging, even for concurrent calls)
+    recorded = db.execute(
+        insert(CreditTransaction)
+        .values(
+            lender_id=request.lender_id,
+            action_type=request.action_type,
+            cost=cost,
+            balance_after=new_balance,
+            target_type=request.target_type,
+            target_id=request.target_id,
+            description=request.description,
+        )
+        .on_conflict_do_nothing(
+            index_elements=["lender_id", "action_type", "target_id"],
+            index_where=CreditTransaction.target_id.isnot(None),
+        )
+        .returning(CreditTransaction.id)
+    ).scalar_one_or_none()
+    if recorded is None:
+        # Undo the debit
+        db.rollback()
+        return SpendResponse(
+            success=True,
+            cost=0,
+            new_balance=current_balance,
+            message="Already performed this action (no charge)"
         )
-        if existing:
-            return SpendResponse(
-                success=True,
-                cost=0,
-                new_balance=current_balance,
-                message="Already performed this action (no charge)"
-            )
-
-    # Record transaction
-    new_balance = current_balance - cost
-    transaction = CreditTransaction(
-        lender_id=request.lender_id,
-        action_type=request.action_type,
-        cost=cost,
-        balance_after=new_balance,
-        target_type=request.target_type,
-        target_id=request.target_id,
-        description=request.description,
-    )
-    db.add(transaction)
     db.commit()
 
     return SpendResponse(
@@ -164,4 +219,4 @@ async def get_history(
 @router.get("/costs", response_model=CreditCosts)
 async def get_costs():
     """Get credit costs for all actions"""
-    return CreditCosts(costs=CREDIT_COSTS)
+    return CREDIT_COSTS_RESPONSE
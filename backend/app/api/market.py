@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends
+from operator import attrgetter
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -11,6 +12,7 @@ from ..schemas.market import (
     ReallocationStats,
 )
 from ..services.anonymizer import group_region
+from ..services.cache import get_cached_aggregate
 
 router = APIRouter()
 
@@ -18,6 +20,12 @@ router = APIRouter()
 @router.get("/inclusion-analysis", response_model=InclusionAnalysis)
 async def get_inclusion_analysis(db: Session = Depends(get_db)):
     """Get financial inclusion analysis by region"""
+    return get_cached_aggregate(
+        "market_inclusion_analysis", lambda: _compute_inclusion_analysis(db)
+    )
+
+
+def _compute_inclusion_analysis(db: Session) -> InclusionAnalysis:
     # Get companies grouped by region with inclusion scores
     results = (
         db.query(
@@ -64,7 +72,7 @@ async def get_inclusion_analysis(db: Session = Depends(get_db)):
         )
 
     # Sort by inclusion percentage descending
-    regions.sort(key=lambda x: x.inclusion_percentage, reverse=True)
+    regions.sort(key=attrgetter("inclusion_percentage"), reverse=True)
 
     # Calculate totals
     total_companies = sum(r.company_count for r in regions)
@@ -87,52 +95,49 @@ from sqlalchemy import Integer
 @router.get("/lender-flows", response_model=list[LenderFlow])
 async def get_lender_flows(db: Session = Depends(get_db)):
     """Get current vs optimal portfolio distribution by lender"""
-    lenders = db.query(Lender).all()
+    return get_cached_aggregate("market_lender_flows", lambda: _compute_lender_flows(db))
 
-    flows = []
-    for lender in lenders:
-        # Current portfolio
-        current_count = (
-            db.query(Loan).filter(Loan.current_lender_id == lender.id).count()
-        )
-        current_value = (
-            db.query(func.sum(Loan.outstanding_balance))
-            .filter(Loan.current_lender_id == lender.id)
-            .scalar()
-            or 0
-        )
 
-        # Optimal portfolio (where this lender is best match)
-        optimal_count = (
-            db.query(Loan).filter(Loan.best_match_lender_id == lender.id).count()
-        )
-        optimal_value = (
-            db.query(func.sum(Loan.outstanding_balance))
-            .filter(Loan.best_match_lender_id == lender.id)
-            .scalar()
-            or 0
-        )
+def _compute_lender_flows(db: Session) -> list[LenderFlow]:
+    lenders = db.query(Lender).all()
 
-        # Inbound (loans from others that fit better here)
-        inbound_count = (
-            db.query(Loan)
-            .filter(
-                Loan.best_match_lender_id == lender.id,
-                Loan.current_lender_id != lender.id,
-            )
-            .count()
+    # Count and value every (current, best match, unaligned) route in one
+    # grouped query instead of six queries per lender
+    routes = (
+        db.query(
+            Loan.current_lender_id,
+            Loan.best_match_lender_id,
+            Loan.is_unalign,
+            func.count(Loan.id),
+            func.sum(Loan.outstanding_balance),
         )
-
-        # Outbound (loans here that fit better elsewhere)
-        outbound_count = (
-            db.query(Loan)
-            .filter(
-                Loan.current_lender_id == lender.id,
-                Loan.best_match_lender_id != lender.id,
-                Loan.is_unalign == True,
-            )
-            .count()
+        .group_by(
+            Loan.current_lender_id, Loan.best_match_lender_id, Loan.is_unalign
         )
+        .all()
+    )
+
+    flows = []
+    for lender in lenders:
+        current_count = current_value = 0
+        optimal_count = optimal_value = 0
+        inbound_count = outbound_count = 0
+        for current_id, best_id, is_unalign, count, value in routes:
+            # Current portfolio
+            if current_id == lender.id:
+                current_count += count
+                current_value += value or 0
+                # Outbound (loans here that fit better elsewhere)
+                if best_id is not None and best_id != lender.id and is_unalign:
+                    outbound_count += count
+
+            # Optimal portfolio (where this lender is best match)
+            if best_id == lender.id:
+                optimal_count += count
+                optimal_value += value or 0
+                # Inbound (loans from others that fit better here)
+                if current_id is not None and current_id != lender.id:
+                    inbound_count += count
 
         flows.append(
             LenderFlow(
@@ -154,6 +159,12 @@ async def get_lender_flows(db: Session = Depends(get_db)):
 @router.get("/reallocation-stats", response_model=ReallocationStats)
 async def get_reallocation_stats(db: Session = Depends(get_db)):
     """Get overall reallocation statistics"""
+    return get_cached_aggregate(
+        "market_reallocation_stats", lambda: _compute_reallocation_stats(db)
+    )
+
+
+def _compute_reallocation_stats(db: Session) -> ReallocationStats:
     # Total loans
     total_loans = db.query(Loan).count()
 
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from typing import Optional
 from datetime import datetime
 
@@ -17,6 +17,7 @@ from ..schemas.marketplace import (
     MarketStats,
 )
 from ..services.anonymizer import anonymize_lender, band_amount
+from ..services.cache import get_cached_aggregate, get_lender_names
 
 router = APIRouter()
 
@@ -47,12 +48,28 @@ async def get_opportunities(
         query = query.filter(Loan.annualized_roi >= min_roi)
 
     results = query.all()
+    lender_names = get_lender_names(db)
+
+    # Interest and bid counts for every listed loan in one grouped query
+    # each, instead of two count queries per loan
+    loan_ids = [loan.id for loan, _, _ in results]
+    interest_counts = dict(
+        db.query(Interest.loan_id, func.count(Interest.id))
+        .filter(Interest.loan_id.in_(loan_ids))
+        .group_by(Interest.loan_id)
+        .all()
+    )
+    bid_counts = dict(
+        db.query(Bid.loan_id, func.count(Bid.id))
+        .filter(Bid.loan_id.in_(loan_ids))
+        .group_by(Bid.loan_id)
+        .all()
+    )
 
     opportunities = []
     for loan, company, listing in results:
-        # Check interest/bids
-        interest_count = db.query(Interest).filter(Interest.loan_id == loan.id).count()
-        bid_count = db.query(Bid).filter(Bid.loan_id == loan.id).count()
+        interest_count = interest_counts.get(loan.id, 0)
+        bid_count = bid_counts.get(loan.id, 0)
 
         opportunities.append(
             LoanOpportunity(
@@ -60,12 +77,7 @@ async def get_opportunities(
                 company_id=company.sme_id,
                 sector=company.sector,
                 region=company.region,
-                seller_lender=anonymize_lender(
-                    db.query(Lender)
-                    .filter(Lender.id == loan.current_lender_id)
-                    .first()
-                    .name
-                ),
+                seller_lender=anonymize_lender(lender_names[loan.current_lender_id]),
                 outstanding_balance=loan.outstanding_balance,
                 outstanding_balance_banded=band_amount(loan.outstanding_balance),
                 years_remaining=loan.years_remaining,
@@ -96,6 +108,47 @@ async def get_my_loans(
     db: Session = Depends(get_db),
 ):
     """Get current lender's loans, optionally filtered to unalignes"""
+    # Only known lenders get a cache entry; any other id holds no loans
+    if lender_id not in get_lender_names(db):
+        return []
+
+    # Loan, company and fit data never change after migration, so the sorted
+    # rows are built once per lender; only listing/bid state is read per call
+    loans = get_cached_aggregate(
+        f"marketplace_my_loans:{lender_id}:{unaligned_only}",
+        lambda: _load_my_loans(db, lender_id, unaligned_only),
+    )
+    loan_ids = [loan["loan_id"] for loan in loans]
+
+    # Active listings and their pending bids, one query each
+    listed_ids = {
+        loan_id
+        for (loan_id,) in db.query(ListedLoan.loan_id).filter(
+            ListedLoan.loan_id.in_(loan_ids), ListedLoan.is_active == True
+        )
+    }
+    bids_by_loan = {}
+    for loan_id, discount_percent in db.query(Bid.loan_id, Bid.discount_percent).filter(
+        Bid.loan_id.in_(listed_ids), Bid.status == "pending"
+    ):
+        bids_by_loan.setdefault(loan_id, []).append(discount_percent)
+
+    my_loans = []
+    for loan in loans:
+        bids = bids_by_loan.get(loan["loan_id"], [])
+        my_loans.append(
+            MyLoan(
+                **loan,
+                is_listed=loan["loan_id"] in listed_ids,
+                bid_count=len(bids),
+                best_bid_discount=min(bids) if bids else None,
+            )
+        )
+
+    return my_loans
+
+
+def _load_my_loans(db: Session, lender_id: int, unaligned_only: bool) -> list[dict]:
     query = (
         db.query(Loan, Company)
         .join(Company, Loan.company_id == Company.id)
@@ -106,35 +159,18 @@ async def get_my_loans(
         query = query.filter(Loan.is_unalign == True)
 
     results = query.all()
+    lender_names = get_lender_names(db)
 
-    my_loans = []
+    loans = []
     for loan, company in results:
-        # Check if listed
-        listing = (
-            db.query(ListedLoan)
-            .filter(ListedLoan.loan_id == loan.id, ListedLoan.is_active == True)
-            .first()
-        )
-
-        # Get bid stats if listed
-        bids = []
-        if listing:
-            bids = (
-                db.query(Bid)
-                .filter(Bid.loan_id == loan.id, Bid.status == "pending")
-                .all()
-            )
-
         # Get best match lender name
         best_match_name = None
         if loan.best_match_lender_id:
-            best_match = (
-                db.query(Lender).filter(Lender.id == loan.best_match_lender_id).first()
-            )
-            best_match_name = anonymize_lender(best_match.name) if best_match else None
+            name = lender_names.get(loan.best_match_lender_id)
+            best_match_name = anonymize_lender(name) if name else None
 
-        my_loans.append(
-            MyLoan(
+        loans.append(
+            dict(
                 loan_id=loan.id,
                 company_id=company.sme_id,
                 sector=company.sector,
@@ -149,15 +185,10 @@ async def get_my_loans(
                 fit_gap=loan.fit_gap,
                 reallocation_status=loan.reallocation_status,
                 suggested_price=loan.suggested_price,
-                is_listed=listing is not None,
-                bid_count=len(bids),
-                best_bid_discount=min([b.discount_percent for b in bids])
-                if bids
-                else None,
             )
         )
 
-    return sorted(my_loans, key=lambda x: x.fit_gap or 0, reverse=True)
+    return sorted(loans, key=lambda x: x["fit_gap"] or 0, reverse=True)
 
 
 @router.post("/list")
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, Query
+import numpy as np
+from operator import attrgetter
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case
 from typing import Optional
 
 from ..core.database import get_db
@@ -10,9 +12,12 @@ from ..schemas.portfolio import (
     SectorDistribution,
     RegionDistribution,
     LenderDistribution,
+    ScoreBin,
+    ScoreDistribution,
     CompanyListItem,
 )
 from ..services.anonymizer import band_amount, group_region
+from ..services.cache import get_cached_aggregate
 
 router = APIRouter()
 
@@ -20,19 +25,24 @@ router = APIRouter()
 @router.get("/overview", response_model=PortfolioOverview)
 async def get_portfolio_overview(db: Session = Depends(get_db)):
     """Get portfolio-wide summary metrics"""
-    # Total companies
-    total_companies = db.query(Company).count()
+    return get_cached_aggregate("portfolio_overview", lambda: _compute_overview(db))
 
-    # Total loan value
-    total_loan_value = db.query(func.sum(Loan.outstanding_balance)).scalar() or 0
 
-    # Unaligned loans
-    total_loans = db.query(Loan).count()
-    unaligned_loans = db.query(Loan).filter(Loan.is_unalign == True).count()
-    unalign_percentage = (unaligned_loans / total_loans * 100) if total_loans > 0 else 0
+def _compute_overview(db: Session) -> PortfolioOverview:
+    # Company totals and loan totals in one aggregate query each
+    total_companies, avg_risk_score = db.query(
+        func.count(Company.id), func.avg(Company.risk_score)
+    ).one()
+    total_loans, total_loan_value, unaligned_loans = db.query(
+        func.count(Loan.id),
+        func.sum(Loan.outstanding_balance),
+        func.sum(case((Loan.is_unalign == True, 1), else_=0)),
+    ).one()
 
-    # Average risk score
-    avg_risk_score = db.query(func.avg(Company.risk_score)).scalar() or 0
+    total_loan_value = total_loan_value or 0
+    unaligned_loans = unaligned_loans or 0
+    avg_risk_score = avg_risk_score or 0
+    unalign_percentage = (unaligned_loans / total_loans * 100) if total_loans > 0 else 0
 
     return PortfolioOverview(
         total_companies=total_companies,
@@ -47,6 +57,10 @@ async def get_portfolio_overview(db: Session = Depends(get_db)):
 @router.get("/by-sector", response_model=list[SectorDistribution])
 async def get_by_sector(db: Session = Depends(get_db)):
     """Get company distribution by sector"""
+    return get_cached_aggregate("portfolio_by_sector", lambda: _compute_by_sector(db))
+
+
+def _compute_by_sector(db: Session) -> list[SectorDistribution]:
     results = (
         db.query(Company.sector, func.count(Company.id).label("count"))
         .group_by(Company.sector)
@@ -63,6 +77,12 @@ async def get_by_region(
     db: Session = Depends(get_db),
 ):
     """Get company distribution by region"""
+    return get_cached_aggregate(
+        f"portfolio_by_region:{grouped}", lambda: _compute_by_region(db, grouped)
+    )
+
+
+def _compute_by_region(db: Session, grouped: bool) -> list[RegionDistribution]:
     results = (
         db.query(Company.region, func.count(Company.id).label("count"))
         .group_by(Company.region)
@@ -81,13 +101,13 @@ async def get_by_region(
                 RegionDistribution(region=region, count=count)
                 for region, count in grouped_counts.items()
             ],
-            key=lambda x: x.count,
+            key=attrgetter("count"),
             reverse=True,
         )
 
     return sorted(
         [RegionDistribution(region=region, count=count) for region, count in results],
-        key=lambda x: x.count,
+        key=attrgetter("count"),
         reverse=True,
     )
 
@@ -95,6 +115,12 @@ async def get_by_region(
 @router.get("/lender-distribution", response_model=list[LenderDistribution])
 async def get_lender_distribution(db: Session = Depends(get_db)):
     """Get loan distribution by current lender"""
+    return get_cached_aggregate(
+        "portfolio_lender_distribution", lambda: _compute_lender_distribution(db)
+    )
+
+
+def _compute_lender_distribution(db: Session) -> list[LenderDistribution]:
     results = (
         db.query(Lender.name, func.count(Loan.id).label("count"))
         .join(Loan, Loan.current_lender_id == Lender.id)
@@ -115,6 +141,88 @@ async def get_lender_distribution(db: Session = Depends(get_db)):
     ]
 
 
+SCORE_COLUMNS = {
+    "risk": Company.risk_score,
+    "inclusion": Company.inclusion_score,
+}
+
+
+@router.get("/score-distribution", response_model=list[ScoreDistribution])
+async def get_score_distribution(
+    bins: int = Query(20, ge=1, le=100, description="Number of histogram bins"),
+    db: Session = Depends(get_db),
+):
+    """Get pre-binned risk and inclusion score histograms (0-100)"""
+    return get_cached_aggregate(
+        f"portfolio_score_distribution:{bins}",
+        lambda: _compute_score_distribution(db, bins),
+    )
+
+
+# Scores are bounded, so histogram bins have fixed, equal widths
+SCORE_RANGE = (0.0, 100.0)
+
+
+def _bin_scores(
+    scores: np.ndarray, bins: int, weights: Optional[np.ndarray] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Count scores in equal-width bins over SCORE_RANGE.
+
+    Each score's bin is found by scaling rather than searching the edges, and
+    counted with bincount. As with np.histogram, the last bin includes the
+    upper bound and out-of-range scores are dropped. If weights are given,
+    each score counts as its weight (e.g. how many rows share it).
+    """
+    lo, hi = SCORE_RANGE
+    edges = np.linspace(lo, hi, bins + 1)
+    in_range = (scores >= lo) & (scores <= hi)
+    scores = scores[in_range]
+    if weights is not None:
+        weights = weights[in_range]
+
+    idx = ((scores - lo) * (bins / (hi - lo))).astype(np.intp)
+    idx[idx == bins] = bins - 1
+    # Nudge scores that float rounding put one bin off, as np.histogram does
+    idx -= scores < edges[idx]
+    idx += (scores >= edges[idx + 1]) & (idx != bins - 1)
+
+    counts = np.bincount(idx, weights=weights, minlength=bins)
+    return counts.astype(np.int64), edges
+
+
+def _compute_score_distribution(db: Session, bins: int) -> list[ScoreDistribution]:
+    distributions = []
+    for metric, column in SCORE_COLUMNS.items():
+        # Scores are stored to one decimal place, so the database collapses
+        # any number of companies into at most ~1,000 (score, count) rows and
+        # only those are binned here
+        rows = (
+            db.query(column, func.count())
+            .filter(column.isnot(None))
+            .group_by(column)
+            .all()
+        )
+        scores = np.array([score for score, _ in rows], dtype=float)
+        weights = np.array([count for _, count in rows], dtype=float)
+        counts, edges = _bin_scores(scores, bins, weights)
+
+        distributions.append(
+            ScoreDistribution(
+                metric=metric,
+                bins=[
+                    ScoreBin(
+                        bin_start=float(edges[i]),
+                        bin_end=float(edges[i + 1]),
+                        count=int(counts[i]),
+                    )
+                    for i in range(bins)
+                ],
+            )
+        )
+
+    return distributions
+
+
 @router.get("/companies", response_model=list[CompanyListItem])
 async def get_companies(
     skip: int = Query(0, ge=0),
@@ -11,6 +11,7 @@ from ..schemas.simulator import (
     LoanFullDetails,
 )
 from ..services.anonymizer import anonymize_lender, band_amount
+from ..services.cache import get_cached_aggregate, get_lender_names
 
 router = APIRouter()
 
@@ -21,6 +22,21 @@ async def get_candidates(
     db: Session = Depends(get_db),
 ):
     """Get loans that are candidates for reallocation simulation"""
+    # Only known lenders get a cache entry; any other id holds no loans
+    if lender_id and lender_id not in get_lender_names(db):
+        return []
+
+    # Loans, fit gaps and lender names never change after migration, so the
+    # ranked candidate list is built once per lender filter
+    return get_cached_aggregate(
+        f"simulator_candidates:{lender_id}",
+        lambda: _load_candidates(db, lender_id),
+    )
+
+
+def _load_candidates(
+    db: Session, lender_id: Optional[int]
+) -> list[SimulatorCandidate]:
     query = (
         db.query(Loan, Company)
         .join(Company, Loan.company_id == Company.id)
@@ -30,15 +46,17 @@ async def get_candidates(
     if lender_id:
         query = query.filter(Loan.current_lender_id == lender_id)
 
-    results = query.all()
+    # Largest fit gap first, read in index order; ties stay in loan order
+    results = query.order_by(Loan.fit_gap.desc(), Loan.id).all()
+
+    # Resolve lender names from the shared map rather than two queries per row
+    lender_names = get_lender_names(db)
 
     candidates = []
     for loan, company in results:
-        current_lender = (
-            db.query(Lender).filter(Lender.id == loan.current_lender_id).first()
-        )
-        best_lender = (
-            db.query(Lender).filter(Lender.id == loan.best_match_lender_id).first()
+        current_name = lender_names.get(loan.current_lender_id)
+        best_name = (
+            lender_names.get(loan.best_match_lender_id)
             if loan.best_match_lender_id
             else None
         )
@@ -49,9 +67,9 @@ async def get_candidates(
                 company_id=company.sme_id,
                 sector=company.sector,
                 region=company.region,
-                current_lender=current_lender.name if current_lender else "Unknown",
-                best_match_lender=anonymize_lender(best_lender.name)
-                if best_lender
+                current_lender=current_name or "Unknown",
+                best_match_lender=anonymize_lender(best_name)
+                if best_name
                 else "Unknown",
                 outstanding_balance=loan.outstanding_balance,
                 outstanding_balance_banded=band_amount(loan.outstanding_balance),
@@ -62,7 +80,7 @@ async def get_candidates(
             )
         )
 
-    return sorted(candidates, key=lambda x: x.fit_gap or 0, reverse=True)
+    return candidates
 
 
 @router.get("/details/{loan_id}", response_model=LoanFullDetails)
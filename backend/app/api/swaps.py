@@ -2,10 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 
 from ..core.database import get_db
-from ..models import Loan, Company, Lender, SwapProposal
+from ..models import Loan, Company, SwapProposal
 from ..schemas.swaps import (
     AutoSwapMatch,
     SwapProposalCreate,
@@ -14,6 +15,7 @@ from ..schemas.swaps import (
     SwapAcceptRequest,
 )
 from ..services.anonymizer import anonymize_lender, band_amount
+from ..services.cache import get_cached_aggregate, get_lender_names
 
 router = APIRouter()
 
@@ -22,9 +24,27 @@ router = APIRouter()
 async def get_auto_matches(
     lender_id: int = Query(..., description="Current lender ID"),
     inclusion_only: bool = Query(False, description="Only show inclusion swaps"),
+    limit: Optional[int] = Query(None, ge=1, description="Only return the top matches"),
     db: Session = Depends(get_db),
 ):
     """Get system-suggested complementary swaps"""
+    # Only known lenders get a cache entry; any other id holds no loans
+    if lender_id not in get_lender_names(db):
+        return []
+
+    # Matches depend only on loan, company and fit data, which never change
+    # after migration, so each lender's full ranked list is computed once and
+    # limit is applied to the cached list
+    matches = get_cached_aggregate(
+        f"swaps_auto_matches:{lender_id}:{inclusion_only}",
+        lambda: _compute_auto_matches(db, lender_id, inclusion_only),
+    )
+    return matches[:limit]
+
+
+def _compute_auto_matches(
+    db: Session, lender_id: int, inclusion_only: bool
+) -> list[AutoSwapMatch]:
     # Find loans where:
     # 1. Lender A has a loan that fits better with Lender B
     # 2. Lender B has a loan that fits better with Lender A
@@ -41,6 +61,29 @@ async def get_auto_matches(
         .all()
     )
 
+    # Every unaligned loan that would fit better with us, indexed by its
+    # current lender, so each of our loans needs a dict lookup, not a query
+    their_loans_by_lender: dict[int, list[Loan]] = {}
+    for loan in (
+        db.query(Loan)
+        .filter(
+            Loan.best_match_lender_id == lender_id,
+            Loan.is_unalign == True,
+            Loan.fit_gap >= 15,
+        )
+        .order_by(Loan.id)
+    ):
+        their_loans_by_lender.setdefault(loan.current_lender_id, []).append(loan)
+
+    # Companies and lenders for every candidate pair, fetched up front
+    company_ids = {loan.company_id for loan in my_unaligned}
+    for loans in their_loans_by_lender.values():
+        company_ids.update(loan.company_id for loan in loans)
+    companies = {
+        c.id: c for c in db.query(Company).filter(Company.id.in_(company_ids))
+    }
+    lender_names = get_lender_names(db)
+
     matches = []
     for my_loan in my_unaligned:
         # Find complementary loans from the best match lender
@@ -48,16 +91,7 @@ async def get_auto_matches(
             continue
 
         # Find their unaligned loans that would fit better with us
-        their_loans = (
-            db.query(Loan)
-            .filter(
-                Loan.current_lender_id == my_loan.best_match_lender_id,
-                Loan.best_match_lender_id == lender_id,
-                Loan.is_unalign == True,
-                Loan.fit_gap >= 15,
-            )
-            .all()
-        )
+        their_loans = their_loans_by_lender.get(my_loan.best_match_lender_id, [])
 
         for their_loan in their_loans:
             # Calculate value difference
@@ -71,12 +105,8 @@ async def get_auto_matches(
                 continue
 
             # Get companies
-            my_company = (
-                db.query(Company).filter(Company.id == my_loan.company_id).first()
-            )
-            their_company = (
-                db.query(Company).filter(Company.id == their_loan.company_id).first()
-            )
+            my_company = companies.get(my_loan.company_id)
+            their_company = companies.get(their_loan.company_id)
 
             # Calculate inclusion bonus
             inclusion_bonus = 0
@@ -97,11 +127,7 @@ async def get_auto_matches(
             swap_score = total_improvement + inclusion_bonus
 
             # Get lender names
-            their_lender = (
-                db.query(Lender)
-                .filter(Lender.id == my_loan.best_match_lender_id)
-                .first()
-            )
+            their_lender = lender_names.get(my_loan.best_match_lender_id)
 
             matches.append(
                 AutoSwapMatch(
@@ -126,7 +152,7 @@ async def get_auto_matches(
                     receive_your_fit=their_loan.best_match_fit,
                     receive_fit_improvement=their_loan.fit_gap,
                     # Swap metrics
-                    counterparty_lender=anonymize_lender(their_lender.name)
+                    counterparty_lender=anonymize_lender(their_lender)
                     if their_lender
                     else "Unknown",
                     total_fit_improvement=total_improvement,
@@ -140,7 +166,7 @@ async def get_auto_matches(
             )
 
     # Sort by swap score
-    return sorted(matches, key=lambda x: x.swap_score, reverse=True)
+    return sorted(matches, key=attrgetter("swap_score"), reverse=True)
 
 
 @router.get("/my-proposals", response_model=list[SwapProposalDetail])
@@ -162,32 +188,35 @@ async def get_my_proposals(
 
     proposals = query.order_by(SwapProposal.created_at.desc()).all()
 
+    # Prefetch every loan, company and lender the proposals refer to, so
+    # building each row is dict lookups instead of up to six queries
+    loan_ids = {p.proposer_loan_id for p in proposals}
+    loan_ids.update(p.counterparty_loan_id for p in proposals if p.counterparty_loan_id)
+    loans = {loan.id: loan for loan in db.query(Loan).filter(Loan.id.in_(loan_ids))}
+    companies = {
+        c.id: c
+        for c in db.query(Company).filter(
+            Company.id.in_({loan.company_id for loan in loans.values()})
+        )
+    }
+    lender_names = get_lender_names(db)
+
     results = []
     for p in proposals:
-        proposer_loan = db.query(Loan).filter(Loan.id == p.proposer_loan_id).first()
+        proposer_loan = loans.get(p.proposer_loan_id)
         counterparty_loan = (
-            db.query(Loan).filter(Loan.id == p.counterparty_loan_id).first()
-            if p.counterparty_loan_id
-            else None
+            loans.get(p.counterparty_loan_id) if p.counterparty_loan_id else None
         )
 
         proposer_company = (
-            db.query(Company).filter(Company.id == proposer_loan.company_id).first()
-            if proposer_loan
-            else None
+            companies.get(proposer_loan.company_id) if proposer_loan else None
         )
         counterparty_company = (
-            db.query(Company).filter(Company.id == counterparty_loan.company_id).first()
-            if counterparty_loan
-            else None
+            companies.get(counterparty_loan.company_id) if counterparty_loan else None
         )
 
-        proposer_lender = (
-            db.query(Lender).filter(Lender.id == p.proposer_lender_id).first()
-        )
-        counterparty_lender = (
-            db.query(Lender).filter(Lender.id == p.counterparty_lender_id).first()
-        )
+        proposer_lender = lender_names.get(p.proposer_lender_id)
+        counterparty_lender = lender_names.get(p.counterparty_lender_id)
 
         is_proposer = p.proposer_lender_id == lender_id
 
@@ -198,9 +227,9 @@ async def get_my_proposals(
                 status=p.status,
                 is_open_swap=p.is_open_swap,
                 # Proposer side
-                proposer_lender=proposer_lender.name
+                proposer_lender=proposer_lender
                 if is_proposer
-                else anonymize_lender(proposer_lender.name),
+                else anonymize_lender(proposer_lender),
                 proposer_loan_id=p.proposer_loan_id,
                 proposer_company_id=proposer_company.sme_id
                 if proposer_company
@@ -208,9 +237,9 @@ async def get_my_proposals(
                 proposer_sector=proposer_company.sector if proposer_company else None,
                 proposer_value=proposer_loan.suggested_price if proposer_loan else None,
                 # Counterparty side
-                counterparty_lender=counterparty_lender.name
+                counterparty_lender=counterparty_lender
                 if not is_proposer
-                else anonymize_lender(counterparty_lender.name),
+                else anonymize_lender(counterparty_lender),
                 counterparty_loan_id=p.counterparty_loan_id,
                 counterparty_company_id=counterparty_company.sme_id
                 if counterparty_company
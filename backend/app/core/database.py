@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
@@ -32,3 +32,47 @@ def get_db():
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
+    upgrade_db()
+
+
+def upgrade_db():
+    """Apply schema additions that create_all skips on existing tables.
+
+    The SQLite file outlives releases on the data volume, and create_all only
+    creates missing tables, so columns added to existing tables are applied
+    here. Each step checks first and is safe to run on every start.
+    """
+    with engine.begin() as conn:
+        lender_columns = {c["name"] for c in inspect(conn).get_columns("lenders")}
+        if "credit_balance" not in lender_columns:
+            conn.execute(text("ALTER TABLE lenders ADD COLUMN credit_balance INTEGER"))
+
+        # /credits/spend relies on this unique index for ON CONFLICT. Repeat
+        # charges recorded before it existed stop it from being built; they
+        # are ledger rows, so they are reported for reconciliation, not removed
+        skipped_indexes = set()
+        credit_indexes = {
+            i["name"] for i in inspect(conn).get_indexes("credit_transactions")
+        }
+        if "ux_credit_transactions_lender_action_target" not in credit_indexes:
+            duplicates = conn.execute(text(
+                "SELECT lender_id, action_type, target_id, COUNT(*)"
+                " FROM credit_transactions WHERE target_id IS NOT NULL"
+                " GROUP BY lender_id, action_type, target_id"
+                " HAVING COUNT(*) > 1"
+            )).all()
+            if duplicates:
+                print(
+                    "Warning: not creating ux_credit_transactions_lender_action_target;"
+                    " credit_transactions has repeat charges to reconcile first"
+                    " (spends fail until it exists):"
+                )
+                for lender_id, action_type, target_id, count in duplicates:
+                    print(f"  lender {lender_id}, {action_type} on {target_id}: {count} rows")
+                skipped_indexes.add("ux_credit_transactions_lender_action_target")
+
+        # Indexes declared on the models since the tables were created
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in skipped_indexes:
+                    index.create(conn, checkfirst=True)
@@ -1,15 +1,30 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index, text
 from datetime import datetime
 from ..core.database import Base
 
 
 class CreditTransaction(Base):
     __tablename__ = "credit_transactions"
+    # Every lookup is per lender, and the balance is read from the latest
+    # transaction; the composite index serves both without a sort. A
+    # targeted action is charged once per lender, which the partial unique
+    # index enforces for /credits/spend
+    __table_args__ = (
+        Index("ix_credit_transactions_lender_timestamp", "lender_id", "timestamp"),
+        Index(
+            "ux_credit_transactions_lender_action_target",
+            "lender_id",
+            "action_type",
+            "target_id",
+            unique=True,
+            sqlite_where=text("target_id IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # Who performed the action
-    lender_id = Column(Integer, index=True)
+    lender_id = Column(Integer)
 
     # Transaction details
     action_type = Column(String)  # view_details, submit_bid, express_interest, etc.
@@ -21,5 +21,9 @@ class Lender(Base):
     preferred_regions = Column(JSON)  # List or None for all
     inclusion_mandate = Column(Boolean, default=False)
 
+    # Running credit balance, kept in step with credit_transactions by
+    # /credits/spend; NULL until the lender's first spend seeds it
+    credit_balance = Column(Integer, nullable=True)
+
     # Relationships - specify foreign_keys to avoid ambiguity with best_match_lender_id
     loans = relationship("Loan", foreign_keys="[Loan.current_lender_id]", back_populates="current_lender")
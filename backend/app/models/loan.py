@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from ..core.database import Base
 
 
 class Loan(Base):
     __tablename__ = "loans"
+    # Reallocation candidates are the unaligned loans ranked by fit gap; the
+    # index keeps them in that order, so listing them needs no sort
+    __table_args__ = (
+        Index("ix_loans_unalign_fit_gap", "is_unalign", "fit_gap"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -23,7 +28,9 @@ class Loan(Base):
     # Matcher analysis (from Matcher agent)
     current_lender_fit = Column(Float)
     current_fit_reasons = Column(JSON)  # Positive/negative factors
-    best_match_lender_id = Column(Integer, ForeignKey("lenders.id"), nullable=True)
+    # Indexed like current_lender_id: inbound lookups ("loans that fit this
+    # lender best") filter on it for marketplace opportunities and swaps
+    best_match_lender_id = Column(Integer, ForeignKey("lenders.id"), nullable=True, index=True)
     best_match_fit = Column(Float)
     best_match_reasons = Column(JSON)
     fit_gap = Column(Float)
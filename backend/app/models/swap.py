@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON, Index
 from datetime import datetime
 from ..core.database import Base
 
@@ -6,15 +6,22 @@ from ..core.database import Base
 class SwapProposal(Base):
     """Loan swap proposals between lenders"""
     __tablename__ = "swap_proposals"
+    # Proposals are looked up per lender on either side, usually narrowed to
+    # a status (e.g. pending incoming offers); the composite indexes serve
+    # both the plain lender lookup and the lender+status filter
+    __table_args__ = (
+        Index("ix_swap_proposals_proposer_status", "proposer_lender_id", "status"),
+        Index("ix_swap_proposals_counterparty_status", "counterparty_lender_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # Proposer side
-    proposer_lender_id = Column(Integer, index=True)
+    proposer_lender_id = Column(Integer)
     proposer_loan_id = Column(Integer, ForeignKey("loans.id"))
 
     # Counterparty side
-    counterparty_lender_id = Column(Integer, index=True)
+    counterparty_lender_id = Column(Integer)
     counterparty_loan_id = Column(Integer, ForeignKey("loans.id"), nullable=True)  # Null for "open" swaps
 
     # Swap details
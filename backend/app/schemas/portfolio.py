@@ -27,6 +27,17 @@ class LenderDistribution(BaseModel):
     percentage: float
 
 
+class ScoreBin(BaseModel):
+    bin_start: float
+    bin_end: float
+    count: int
+
+
+class ScoreDistribution(BaseModel):
+    metric: str
+    bins: list[ScoreBin]
+
+
 class CompanyListItem(BaseModel):
     id: int
     sme_id: str
@@ -1,6 +1,7 @@
 """Anonymization utilities for privacy-preserving data display"""
 
-from typing import Dict
+from bisect import bisect_right
+from typing import Dict, List
 
 # Lender anonymization mapping (session-based in real app)
 _lender_mapping: Dict[str, str] = {}
@@ -26,83 +27,95 @@ def reset_anonymization():
     _lender_counter = 0
 
 
+# Region -> macro-region lookup, built once at import
+REGION_GROUPS: Dict[str, str] = {
+    # Northern England
+    "North East": "Northern England",
+    "North West": "Northern England",
+    "Yorkshire and The Humber": "Northern England",
+    "Yorkshire": "Northern England",
+    # Midlands
+    "East Midlands": "Midlands",
+    "West Midlands": "Midlands",
+    # Southern England
+    "South East": "Southern England",
+    "South West": "Southern England",
+    "East of England": "Southern England",
+    "East Of England": "Southern England",
+    "East": "Southern England",
+    # London
+    "London": "Greater London",
+    "Greater London": "Greater London",
+    # Devolved nations
+    "Scotland": "Scotland",
+    "Wales": "Wales",
+    "Northern Ireland": "Northern Ireland",
+}
+
+# Band lookups: upper bounds (exclusive) and labels, with one extra label
+# for values at or above the last bound
+AMOUNT_BAND_BOUNDS: List[float] = [
+    100_000,
+    500_000,
+    1_000_000,
+    2_000_000,
+    5_000_000,
+    10_000_000,
+    25_000_000,
+    50_000_000,
+    100_000_000,
+]
+AMOUNT_BAND_LABELS: List[str] = [
+    "<£100k",
+    "£100k-£500k",
+    "£500k-£1M",
+    "£1M-£2M",
+    "£2M-£5M",
+    "£5M-£10M",
+    "£10M-£25M",
+    "£25M-£50M",
+    "£50M-£100M",
+    ">£100M",
+]
+
+TURNOVER_BAND_BOUNDS: List[float] = [
+    1_000_000,
+    5_000_000,
+    10_000_000,
+    25_000_000,
+    50_000_000,
+    100_000_000,
+]
+TURNOVER_BAND_LABELS: List[str] = [
+    "<£1M",
+    "£1M-£5M",
+    "£5M-£10M",
+    "£10M-£25M",
+    "£25M-£50M",
+    "£50M-£100M",
+    ">£100M",
+]
+
+
 def group_region(region: str) -> str:
     """Group UK regions into larger categories"""
     if region is None:
         return "Unknown"
-
-    region_groups = {
-        # Northern England
-        "North East": "Northern England",
-        "North West": "Northern England",
-        "Yorkshire and The Humber": "Northern England",
-        "Yorkshire": "Northern England",
-        # Midlands
-        "East Midlands": "Midlands",
-        "West Midlands": "Midlands",
-        # Southern England
-        "South East": "Southern England",
-        "South West": "Southern England",
-        "East of England": "Southern England",
-        "East Of England": "Southern England",
-        "East": "Southern England",
-        # London
-        "London": "Greater London",
-        "Greater London": "Greater London",
-        # Devolved nations
-        "Scotland": "Scotland",
-        "Wales": "Wales",
-        "Northern Ireland": "Northern Ireland",
-    }
-    return region_groups.get(region, region)
+    return REGION_GROUPS.get(region, region)
 
 
 def band_amount(amount: float) -> str:
     """Band financial amounts into ranges"""
     if amount is None:
         return "N/A"
-
-    if amount < 100_000:
-        return "<£100k"
-    elif amount < 500_000:
-        return "£100k-£500k"
-    elif amount < 1_000_000:
-        return "£500k-£1M"
-    elif amount < 2_000_000:
-        return "£1M-£2M"
-    elif amount < 5_000_000:
-        return "£2M-£5M"
-    elif amount < 10_000_000:
-        return "£5M-£10M"
-    elif amount < 25_000_000:
-        return "£10M-£25M"
-    elif amount < 50_000_000:
-        return "£25M-£50M"
-    elif amount < 100_000_000:
-        return "£50M-£100M"
-    else:
-        return ">£100M"
+    return AMOUNT_BAND_LABELS[bisect_right(AMOUNT_BAND_BOUNDS, amount)]
 
 
 def band_turnover(turnover: float) -> str:
     """Band company turnover into ranges"""
     if turnover is None:
         return "N/A"
-
-    if turnover < 1_000_000:
-        return "<£1M"
-    elif turnover < 5_000_000:
-        return "£1M-£5M"
-    elif turnover < 10_000_000:
-        return "£5M-£10M"
-    elif turnover < 25_000_000:
-        return "£10M-£25M"
-    elif turnover < 50_000_000:
-        return "£25M-£50M"
-    elif turnover < 100_000_000:
-        return "£50M-£100M"
-    else:
-        return ">£100M"
+    return TURNOVER_BAND_LABELS[bisect_right(TURNOVER_BAND_BOUNDS, turnover)]
 
 
 def round_score(score: float, nearest: int = 5) -> float:
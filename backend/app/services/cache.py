@@ -0,0 +1,37 @@
+"""In-process cache for aggregates over the static company/loan tables"""
+
+from typing import Any, Callable, Dict
+
+from sqlalchemy.orm import Session
+
+from ..models import Lender
+
+# Company and loan rows are written once by the migration and only read by the
+# API, so portfolio-level aggregates can be computed once per process.
+_aggregate_cache: Dict[str, Any] = {}
+
+
+def get_cached_aggregate(key: str, compute: Callable[[], Any]) -> Any:
+    """Return the cached aggregate for key, computing it on first use.
+
+    A None result (e.g. a lookup for a row that does not exist) is returned
+    but not stored, so arbitrary missing ids cannot grow the cache.
+    """
+    if key in _aggregate_cache:
+        return _aggregate_cache[key]
+    value = compute()
+    if value is not None:
+        _aggregate_cache[key] = value
+    return value
+
+
+def get_lender_names(db: Session) -> Dict[int, str]:
+    """Return the lender id -> name map, queried once per process"""
+    return get_cached_aggregate(
+        "lender_names", lambda: dict(db.query(Lender.id, Lender.name).all())
+    )
+
+
+def clear_aggregate_cache():
+    """Drop all cached aggregates (call after reloading company/loan data)"""
+    _aggregate_cache.clear()
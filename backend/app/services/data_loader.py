@@ -2,8 +2,11 @@
 
 import pandas as pd
 import numpy as np
+import hashlib
+import json
 import sys
 import os
+from pathlib import Path
 
 # Add parent directories to path to import existing agents
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
@@ -11,6 +14,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..
 from sqlalchemy.orm import Session
 from ..models import Company, Loan, Lender
 from ..core.database import engine, SessionLocal
+from .cache import clear_aggregate_cache
 
 # Import existing agents
 try:
@@ -25,6 +29,25 @@ except ImportError:
     print("Warning: Could not import agents, using simplified data loading")
     AGENTS_AVAILABLE = False
 
+# Part of the processed-data cache key: bump when the pipeline's output
+# changes in a way its source files' timestamps would not show
+PIPELINE_VERSION = 2
+
+# Label columns stored as pandas categoricals before the agents run
+CATEGORICAL_COLUMNS = ["Sector", "Region", "Current_Lender"]
+
+# Modules whose code shapes the processed frame; editing any of them (the
+# agents and lenders are bind-mounted in docker-compose) invalidates the cache
+PIPELINE_MODULES = (
+    __name__,
+    "agents.risk_analyst",
+    "agents.inclusion_scanner",
+    "agents.matcher",
+    "agents.pricer",
+    "lenders.profiles",
+    "utils.anonymizer",
+)
+
 
 def load_excel_data(file_path: str) -> pd.DataFrame:
     """Load and process Excel data"""
@@ -59,24 +82,21 @@ def simulate_loans(df: pd.DataFrame, lender_names: list) -> pd.DataFrame:
     )
     df["Interest_Rate"] = np.random.uniform(0.045, 0.075, size=len(df))
 
-    # Calculate outstanding balance (linear amortization)
-    df["Outstanding_Balance"] = df.apply(
-        lambda row: row["Loan_Amount"]
-        * (row["Years_Remaining"] / row["Loan_Term_Years"])
-        if row["Loan_Term_Years"] > 0
-        else 0,
-        axis=1,
+    # Calculate outstanding balance (linear amortization), vectorized over
+    # the term columns rather than built row by row
+    has_term = df["Loan_Term_Years"] > 0
+    df["Outstanding_Balance"] = np.where(
+        has_term,
+        df["Loan_Amount"] * (df["Years_Remaining"] / df["Loan_Term_Years"]),
+        0,
     )
 
     # Monthly payment (simplified)
-    df["Monthly_Payment"] = df.apply(
-        lambda row: (
-            row["Loan_Amount"] * (1 + row["Interest_Rate"] * row["Loan_Term_Years"])
-        )
-        / (row["Loan_Term_Years"] * 12)
-        if row["Loan_Term_Years"] > 0
-        else 0,
-        axis=1,
+    df["Monthly_Payment"] = np.where(
+        has_term,
+        (df["Loan_Amount"] * (1 + df["Interest_Rate"] * df["Loan_Term_Years"]))
+        / (df["Loan_Term_Years"] * 12),
+        0,
     )
 
     # Assign random current lender
@@ -90,6 +110,12 @@ def simulate_loans(df: pd.DataFrame, lender_names: list) -> pd.DataFrame:
 
 def run_analysis_pipeline(df: pd.DataFrame, lenders: list) -> pd.DataFrame:
     """Run all analysis agents on the data"""
+    # Low-cardinality labels as categoricals, as utils.data_loader.load_data
+    # does, so the agents' per-sector/region/lender masks compare codes
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
     if not AGENTS_AVAILABLE:
         print("Agents not available, using placeholder scores")
         df["Risk_Score"] = np.random.uniform(30, 80, size=len(df))
@@ -123,6 +149,72 @@ def run_analysis_pipeline(df: pd.DataFrame, lenders: list) -> pd.DataFrame:
     return df
 
 
+def _processed_cache_key(lenders_data: list) -> str:
+    """Fingerprint of the pipeline version and lender profiles"""
+    payload = json.dumps(
+        [PIPELINE_VERSION, lenders_data], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _pipeline_mtime(excel_file: Path) -> float:
+    """Latest modification time of the workbook and the pipeline code"""
+    sources = [excel_file] + [
+        Path(sys.modules[name].__file__)
+        for name in PIPELINE_MODULES
+        if name in sys.modules
+    ]
+    return max(path.stat().st_mtime for path in sources)
+
+
+def load_processed_data(excel_path: str, lenders_data: list) -> pd.DataFrame:
+    """Load the Excel data and run the agents, reusing a cached result.
+
+    The post-agent frame is pickled next to the workbook together with a
+    key for the pipeline version and lender profiles, and read back while
+    the key matches and neither the workbook nor the pipeline code has
+    changed since. A restart then skips the Excel parse and the four agents.
+    Pickle rather than Parquet: the fit reasons and inclusion flags columns
+    hold dicts and lists.
+    """
+    excel_file = Path(excel_path)
+    cache_file = excel_file.with_suffix(".processed.pkl")
+    cache_key = _processed_cache_key(lenders_data)
+    if (
+        AGENTS_AVAILABLE
+        and cache_file.exists()
+        and cache_file.stat().st_mtime >= _pipeline_mtime(excel_file)
+    ):
+        try:
+            cached = pd.read_pickle(cache_file)
+        except Exception:
+            # Unreadable cache: rebuild and overwrite it below
+            cached = None
+        if isinstance(cached, dict) and cached.get("key") == cache_key:
+            print(f"Loading processed data from {cache_file}...")
+            return cached["df"]
+
+    lender_names = [l["name"] for l in lenders_data]
+
+    df = load_excel_data(excel_path)
+    df = simulate_loans(df, lender_names)
+    df = run_analysis_pipeline(df, lenders_data)
+
+    # Placeholder scores are not worth keeping
+    if AGENTS_AVAILABLE:
+        # Write to a temp file and swap it in, so an interrupted write never
+        # leaves a partial cache behind
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            pd.to_pickle({"key": cache_key, "df": df}, tmp_file)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # Read-only data dir: rerun the pipeline next time
+            tmp_file.unlink(missing_ok=True)
+
+    return df
+
+
 def migrate_to_database(df: pd.DataFrame, lenders_data: list):
     """Migrate processed data to SQLite database"""
     db = SessionLocal()
@@ -155,11 +247,12 @@ def migrate_to_database(df: pd.DataFrame, lenders_data: list):
         db.commit()
         print(f"Inserted {len(lenders_data)} lenders")
 
-        # Insert companies and loans
-        for _, row in df.iterrows():
+        # Insert companies and loans. Rows are read as plain dict records,
+        # which are much cheaper to build than the Series iterrows() makes
+        for idx, row in zip(df.index, df.to_dict("records")):
             # Create company
             company = Company(
-                sme_id=row.get("SME_ID", f"SME_{_}"),
+                sme_id=row.get("SME_ID", f"SME_{idx}"),
                 sector=row.get("Sector", "Unknown"),
                 region=row.get("Region", "Unknown"),
                 turnover=row.get("Turnover"),
@@ -245,6 +338,9 @@ def migrate_to_database(df: pd.DataFrame, lenders_data: list):
         db.commit()
         print(f"Inserted {len(df)} companies and loans")
 
+        # Portfolio aggregates were computed from the previous data
+        clear_aggregate_cache()
+
     except Exception as e:
         db.rollback()
         raise e
@@ -311,12 +407,8 @@ def run_migration(excel_path: str = None):
             },
         ]
 
-    lender_names = [l["name"] for l in lenders_data]
-
     # Load and process data
-    df = load_excel_data(excel_path)
-    df = simulate_loans(df, lender_names)
-    df = run_analysis_pipeline(df, lenders_data)
+    df = load_processed_data(excel_path, lenders_data)
 
     # Migrate to database
     migrate_to_database(df, lenders_data)
@@ -1,11 +1,15 @@
+import { lazy } from 'react'
 import { BrowserRouter, Routes, Route, Navigate } from 'react-router-dom'
 import Layout from './components/Layout'
 import PortfolioOverview from './pages/PortfolioOverview'
-import CompanyAnalysis from './pages/CompanyAnalysis'
-import Marketplace from './pages/Marketplace'
-import Swaps from './pages/Swaps'
-import MarketIntel from './pages/MarketIntel'
-import Simulator from './pages/Simulator'
+
+// The landing page ships in the main bundle; the rest are split into their
+// own chunks and only downloaded when first visited
+const CompanyAnalysis = lazy(() => import('./pages/CompanyAnalysis'))
+const Marketplace = lazy(() => import('./pages/Marketplace'))
+const Swaps = lazy(() => import('./pages/Swaps'))
+const MarketIntel = lazy(() => import('./pages/MarketIntel'))
+const Simulator = lazy(() => import('./pages/Simulator'))
 
 function App() {
   return (
@@ -1,3 +1,5 @@
+import { memo } from 'react'
+
 interface BarChartItem {
   label: string
   value: number
@@ -21,7 +23,9 @@ const defaultColors = [
   'bg-pink-400',
 ]
 
-export default function BarChart({ title, items, icon, maxValue }: BarChartProps) {
+// Memoized: dashboard pages re-render as each of their queries resolves,
+// and a chart whose items are unchanged keeps its existing bars
+function BarChart({ title, items, icon, maxValue }: BarChartProps) {
   const max = maxValue || Math.max(...items.map((i) => i.value))
 
   return (
@@ -49,3 +53,5 @@ export default function BarChart({ title, items, icon, maxValue }: BarChartProps
     </div>
   )
 }
+
+export default memo(BarChart)
@@ -1,3 +1,4 @@
+import { Suspense } from 'react'
 import { Outlet } from 'react-router-dom'
 import Sidebar from './Sidebar'
 
@@ -6,7 +7,9 @@ export default function Layout() {
     <div className="flex h-screen w-full overflow-hidden">
       <Sidebar />
       <main className="flex-1 flex flex-col h-full overflow-hidden bg-background-dark">
-        <Outlet />
+        <Suspense fallback={null}>
+          <Outlet />
+        </Suspense>
       </main>
     </div>
   )
@@ -1,3 +1,5 @@
+import { memo } from 'react'
+
 interface PieChartItem {
   label: string
   value: number
@@ -11,7 +13,8 @@ interface PieChartProps {
   centerLabel?: string
 }
 
-export default function PieChart({ title, items, centerLabel }: PieChartProps) {
+// Memoized like BarChart, so the gradient is only rebuilt when items change
+function PieChart({ title, items, centerLabel }: PieChartProps) {
   // Build conic gradient
   let gradientStops = ''
   let currentPercent = 0
@@ -51,3 +54,5 @@ export default function PieChart({ title, items, centerLabel }: PieChartProps) {
     </div>
   )
 }
+
+export default memo(PieChart)
@@ -6,6 +6,14 @@ import Badge from '../components/Badge'
 import Button from '../components/Button'
 import { portfolioApi, companyApi } from '../services/api'
 
+// Component scores shown under the risk assessment, as [label, company field]
+const RISK_COMPONENTS = [
+  ['Liquidity', 'liquidity_score'],
+  ['Profitability', 'profitability_score'],
+  ['Leverage', 'leverage_score'],
+  ['Cash Position', 'cash_score'],
+] as const
+
 export default function CompanyAnalysis() {
   const [selectedCompanyId, setSelectedCompanyId] = useState<number | null>(null)
 
@@ -111,21 +119,16 @@ export default function CompanyAnalysis() {
                   </div>
                 </div>
                 <div className="space-y-2 text-xs">
-                  {[
-                    { label: 'Liquidity', value: company.liquidity_score },
-                    { label: 'Profitability', value: company.profitability_score },
-                    { label: 'Leverage', value: company.leverage_score },
-                    { label: 'Cash Position', value: company.cash_score },
-                  ].map((item) => (
-                    <div key={item.label} className="flex items-center gap-2">
-                      <span className="text-slate-400 w-24">{item.label}</span>
+                  {RISK_COMPONENTS.map(([label, field]) => (
+                    <div key={label} className="flex items-center gap-2">
+                      <span className="text-slate-400 w-24">{label}</span>
                       <div className="flex-1 bg-slate-800 h-1.5 rounded-full">
                         <div
                           className="bg-primary h-full rounded-full"
-                          style={{ width: `${item.value || 0}%` }}
+                          style={{ width: `${company[field] || 0}%` }}
                         />
                       </div>
-                      <span className="text-slate-300 w-8 text-right">{item.value?.toFixed(0) || 0}</span>
+                      <span className="text-slate-300 w-8 text-right">{company[field]?.toFixed(0) || 0}</span>
                     </div>
                   ))}
                 </div>
@@ -6,7 +6,7 @@ import Card from '../components/Card'
 import MetricCard from '../components/MetricCard'
 import Badge from '../components/Badge'
 import Button from '../components/Button'
-import { marketApi } from '../services/api'
+import { marketApi, STATIC_STALE_TIME } from '../services/api'
 
 const tabs = [
   { id: 'insights', label: 'Market Insights', icon: 'insights' },
@@ -14,22 +14,39 @@ const tabs = [
   { id: 'inclusion', label: 'Inclusion Reports', icon: 'diversity_3' },
 ]
 
+// Bar widths are worked out in the query's `select`, so they are recomputed
+// only when the fetched flows change rather than on every render
+const toFlowBars = (data: { current_count: number; optimal_count: number }[]) =>
+  data.map((flow) => {
+    const scale = Math.max(flow.current_count, flow.optimal_count)
+    return {
+      ...flow,
+      currentWidth: Math.min((flow.current_count / scale) * 100, 100),
+      optimalWidth: Math.min((flow.optimal_count / scale) * 100, 100),
+    }
+  })
+
 export default function MarketIntel() {
   const [activeTab, setActiveTab] = useState('insights')
 
   const { data: reallocationStats } = useQuery({
     queryKey: ['reallocation-stats'],
     queryFn: () => marketApi.getReallocationStats().then((res) => res.data),
+    staleTime: STATIC_STALE_TIME,
   })
 
   const { data: inclusionAnalysis } = useQuery({
     queryKey: ['inclusion-analysis'],
     queryFn: () => marketApi.getInclusionAnalysis().then((res) => res.data),
+    staleTime: STATIC_STALE_TIME,
   })
 
   const { data: lenderFlows } = useQuery({
     queryKey: ['lender-flows'],
     queryFn: () => marketApi.getLenderFlows().then((res) => res.data),
+    staleTime: STATIC_STALE_TIME,
+    enabled: activeTab === 'flows',
+    select: toFlowBars,
   })
 
   return (
@@ -169,12 +186,7 @@ export default function MarketIntel() {
                             <div className="bg-slate-800 h-2 rounded-full">
                               <div
                                 className="bg-slate-500 h-full rounded-full"
-                                style={{
-                                  width: `${Math.min(
-                                    (flow.current_count / Math.max(flow.current_count, flow.optimal_count)) * 100,
-                                    100
-                                  )}%`,
-                                }}
+                                style={{ width: `${flow.currentWidth}%` }}
                               />
                             </div>
                           </div>
@@ -186,12 +198,7 @@ export default function MarketIntel() {
                             <div className="bg-slate-800 h-2 rounded-full">
                               <div
                                 className="bg-accent-teal h-full rounded-full"
-                                style={{
-                                  width: `${Math.min(
-                                    (flow.optimal_count / Math.max(flow.current_count, flow.optimal_count)) * 100,
-                                    100
-                                  )}%`,
-                                }}
+                                style={{ width: `${flow.optimalWidth}%` }}
                               />
                             </div>
                           </div>
@@ -14,9 +14,41 @@ const tabs = [
   { id: 'buy', label: 'Opportunities to Buy', icon: 'shopping_cart' },
 ]
 
+// The discount slider keeps its value in local state, so dragging it only
+// re-renders this form; the bid is sent once, on submit
+function BidForm({ onSubmit, isPending }: { onSubmit: (discount: number) => void; isPending: boolean }) {
+  const [discount, setDiscount] = useState(10)
+
+  return (
+    <form
+      className="mt-4 flex items-center gap-3"
+      onClick={(e) => e.stopPropagation()}
+      onSubmit={(e) => {
+        e.preventDefault()
+        onSubmit(discount)
+      }}
+    >
+      <span className="text-xs text-slate-400 whitespace-nowrap">Discount {discount}%</span>
+      <input
+        type="range"
+        min={0}
+        max={30}
+        step={5}
+        value={discount}
+        onChange={(e) => setDiscount(Number(e.target.value))}
+        className="flex-1 accent-primary"
+      />
+      <Button type="submit" variant="primary" size="sm" icon="gavel" disabled={isPending}>
+        Confirm Bid (3)
+      </Button>
+    </form>
+  )
+}
+
 export default function Marketplace() {
   const [activeTab, setActiveTab] = useState('sell')
   const [selectedLoan, setSelectedLoan] = useState<number | null>(null)
+  const [biddingLoan, setBiddingLoan] = useState<number | null>(null)
   const { currentLender } = useLenderStore()
   const { balance } = useCreditsStore()
   const queryClient = useQueryClient()
@@ -24,13 +56,13 @@ export default function Marketplace() {
   const { data: myLoans } = useQuery({
     queryKey: ['my-loans', currentLender?.id],
     queryFn: () => marketplaceApi.getMyLoans(currentLender!.id).then((res) => res.data),
-    enabled: !!currentLender?.id,
+    enabled: !!currentLender?.id && activeTab === 'sell',
   })
 
   const { data: opportunities } = useQuery({
     queryKey: ['opportunities', currentLender?.id],
     queryFn: () => marketplaceApi.getOpportunities(currentLender!.id).then((res) => res.data),
-    enabled: !!currentLender?.id,
+    enabled: !!currentLender?.id && activeTab === 'buy',
   })
 
   const listMutation = useMutation({
@@ -40,7 +72,17 @@ export default function Marketplace() {
 
   const interestMutation = useMutation({
     mutationFn: (loanId: number) => marketplaceApi.expressInterest(loanId, currentLender!.id),
-    onSuccess: () => queryClient.invalidateQueries({ queryKey: ['opportunities'] }),
+    // A repeat click returns status 'exists' and changes nothing, so the
+    // opportunities list only needs refetching when interest was recorded
+    onSuccess: (res) => {
+      if (res.data.status !== 'exists') queryClient.invalidateQueries({ queryKey: ['opportunities'] })
+    },
+  })
+
+  const bidMutation = useMutation({
+    mutationFn: ({ loanId, discount }: { loanId: number; discount: number }) =>
+      marketplaceApi.submitBid(loanId, currentLender!.id, discount),
+    onSuccess: () => setBiddingLoan(null),
   })
 
   return (
@@ -205,10 +247,24 @@ export default function Marketplace() {
                         >
                           Express Interest (5)
                         </Button>
-                        <Button variant="ghost" size="sm" icon="gavel">
+                        <Button
+                          variant="ghost"
+                          size="sm"
+                          icon="gavel"
+                          onClick={(e) => {
+                            e.stopPropagation()
+                            setBiddingLoan(biddingLoan === loan.loan_id ? null : loan.loan_id)
+                          }}
+                        >
                           Submit Bid (3)
                         </Button>
                       </div>
+                      {biddingLoan === loan.loan_id && (
+                        <BidForm
+                          isPending={bidMutation.isPending}
+                          onSubmit={(discount) => bidMutation.mutate({ loanId: loan.loan_id, discount })}
+                        />
+                      )}
                     </Card>
                   ))
                 ) : (
@@ -4,30 +4,74 @@ import MetricCard from '../components/MetricCard'
 import BarChart from '../components/BarChart'
 import PieChart from '../components/PieChart'
 import Button from '../components/Button'
-import { portfolioApi } from '../services/api'
+import { portfolioApi, STATIC_STALE_TIME } from '../services/api'
+
+const pieColors = ['#135bec', '#14b8a6', '#818cf8', '#38bdf8']
+
+// Shared fallback so memoized charts see the same empty list on every render
+const noBins: { label: string; value: number }[] = []
+
+// Chart items are shaped in each query's `select`, so they are rebuilt only
+// when the fetched data changes rather than on every render
+const toSectorItems = (data: { sector: string; count: number }[]) =>
+  data.map((s) => ({ label: s.sector, value: s.count }))
+
+const toRegionItems = (data: { region: string; count: number }[]) =>
+  data.map((r) => ({ label: r.region, value: r.count }))
+
+const toLenderItems = (data: { lender: string; count: number; percentage: number }[]) =>
+  data.map((l, i) => ({
+    label: l.lender,
+    value: l.count,
+    percentage: l.percentage,
+    color: pieColors[i % pieColors.length],
+  }))
+
+const toScoreBins = (
+  data: { metric: string; bins: { bin_start: number; bin_end: number; count: number }[] }[]
+) =>
+  Object.fromEntries(
+    data.map((d) => [
+      d.metric,
+      d.bins.map((b) => ({ label: `${b.bin_start}-${b.bin_end}`, value: b.count })),
+    ])
+  )
 
 export default function PortfolioOverview() {
   const { data: overview } = useQuery({
     queryKey: ['portfolio-overview'],
     queryFn: () => portfolioApi.getOverview().then((res) => res.data),
+    staleTime: STATIC_STALE_TIME,
   })
 
-  const { data: sectorData } = useQuery({
+  const { data: sectorItems = [] } = useQuery({
     queryKey: ['portfolio-sector'],
     queryFn: () => portfolioApi.getBySector().then((res) => res.data),
+    staleTime: STATIC_STALE_TIME,
+    select: toSectorItems,
   })
 
-  const { data: regionData } = useQuery({
+  const { data: regionItems = [] } = useQuery({
     queryKey: ['portfolio-region'],
     queryFn: () => portfolioApi.getByRegion().then((res) => res.data),
+    staleTime: STATIC_STALE_TIME,
+    select: toRegionItems,
   })
 
-  const { data: lenderData } = useQuery({
+  const { data: lenderItems = [] } = useQuery({
     queryKey: ['portfolio-lender'],
     queryFn: () => portfolioApi.getLenderDistribution().then((res) => res.data),
+    staleTime: STATIC_STALE_TIME,
+    select: toLenderItems,
   })
 
-  const pieColors = ['#135bec', '#14b8a6', '#818cf8', '#38bdf8']
+  // Histograms arrive pre-binned from the API, so only bin counts are sent
+  const { data: scoreBins = {} } = useQuery({
+    queryKey: ['portfolio-score-distribution'],
+    queryFn: () => portfolioApi.getScoreDistribution(10).then((res) => res.data),
+    staleTime: STATIC_STALE_TIME,
+    select: toScoreBins,
+  })
 
   return (
     <>
@@ -76,41 +120,22 @@ export default function PortfolioOverview() {
 
           {/* Charts Row */}
           <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-            <BarChart
-              title="Companies by Sector"
-              icon="bar_chart"
-              items={
-                sectorData?.map((s: { sector: string; count: number }) => ({
-                  label: s.sector,
-                  value: s.count,
-                })) || []
-              }
-            />
-            <BarChart
-              title="Companies by Region"
-              icon="location_on"
-              items={
-                regionData?.map((r: { region: string; count: number }) => ({
-                  label: r.region,
-                  value: r.count,
-                })) || []
-              }
-            />
+            <BarChart title="Companies by Sector" icon="bar_chart" items={sectorItems} />
+            <BarChart title="Companies by Region" icon="location_on" items={regionItems} />
+          </div>
+
+          {/* Score Distributions */}
+          <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+            <BarChart title="Risk Score Distribution" icon="monitoring" items={scoreBins.risk || noBins} />
+            <BarChart title="Inclusion Score Distribution" icon="diversity_3" items={scoreBins.inclusion || noBins} />
           </div>
 
           {/* Bottom Row */}
           <div className="grid grid-cols-1 lg:grid-cols-3 gap-6 pb-10">
             <PieChart
               title="Current Lender Distribution"
-              centerLabel={`Top ${lenderData?.length || 0}\nLenders`}
-              items={
-                lenderData?.map((l: { lender: string; count: number; percentage: number }, i: number) => ({
-                  label: l.lender,
-                  value: l.count,
-                  percentage: l.percentage,
-                  color: pieColors[i % pieColors.length],
-                })) || []
-              }
+              centerLabel={`Top ${lenderItems.length}\nLenders`}
+              items={lenderItems}
             />
 
             {/* Hotspots Map */}
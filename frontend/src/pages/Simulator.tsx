@@ -1,4 +1,4 @@
-import { useState } from 'react'
+import { useMemo, useState } from 'react'
 import { useQuery, useMutation } from '@tanstack/react-query'
 import Header from '../components/Header'
 import Tabs from '../components/Tabs'
@@ -26,6 +26,30 @@ export default function Simulator() {
     enabled: !!currentLender?.id,
   })
 
+  // Option lists only change with the candidates (and the outgoing pick),
+  // not on every render triggered by the simulation or tab state
+  const outgoingOptions = useMemo(
+    () =>
+      candidates?.map((c: any) => (
+        <option key={c.loan_id} value={c.loan_id}>
+          {c.company_id} - {c.sector} ({c.outstanding_balance_banded})
+        </option>
+      )),
+    [candidates]
+  )
+
+  const incomingOptions = useMemo(
+    () =>
+      candidates
+        ?.filter((c: any) => c.loan_id !== outgoingLoanId)
+        .map((c: any) => (
+          <option key={c.loan_id} value={c.loan_id}>
+            {c.company_id} - {c.sector} ({c.outstanding_balance_banded})
+          </option>
+        )),
+    [candidates, outgoingLoanId]
+  )
+
   const { data: outgoingDetails } = useQuery({
     queryKey: ['loan-details', outgoingLoanId],
     queryFn: () => simulatorApi.getLoanDetails(outgoingLoanId!).then((res) => res.data),
@@ -74,11 +98,7 @@ export default function Simulator() {
                 className="w-full bg-slate-800 border-slate-700 text-sm text-white rounded px-3 py-2 focus:ring-primary"
               >
                 <option value="">Select a loan to transfer...</option>
-                {candidates?.map((c: any) => (
-                  <option key={c.loan_id} value={c.loan_id}>
-                    {c.company_id} - {c.sector} ({c.outstanding_balance_banded})
-                  </option>
-                ))}
+                {outgoingOptions}
               </select>
             </div>
 
@@ -91,13 +111,7 @@ export default function Simulator() {
                   className="w-full bg-slate-800 border-slate-700 text-sm text-white rounded px-3 py-2 focus:ring-primary"
                 >
                   <option value="">Select a loan to receive...</option>
-                  {candidates
-                    ?.filter((c: any) => c.loan_id !== outgoingLoanId)
-                    .map((c: any) => (
-                      <option key={c.loan_id} value={c.loan_id}>
-                        {c.company_id} - {c.sector} ({c.outstanding_balance_banded})
-                      </option>
-                    ))}
+                  {incomingOptions}
                 </select>
               </div>
             )}
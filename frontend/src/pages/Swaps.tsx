@@ -1,4 +1,4 @@
-import { useState } from 'react'
+import { useMemo, useState } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import Header from '../components/Header'
 import Tabs from '../components/Tabs'
@@ -14,6 +14,38 @@ const tabs = [
   { id: 'manual', label: 'Manual Proposals', icon: 'edit' },
 ]
 
+// One half of a swap card; the give and receive sides share this layout
+function SwapSide({
+  label,
+  labelClassName,
+  companyId,
+  sector,
+  valueBanded,
+  fitLabel,
+  fitImprovement,
+}: {
+  label: string
+  labelClassName: string
+  companyId: string
+  sector: string
+  valueBanded: string
+  fitLabel: string
+  fitImprovement?: number
+}) {
+  return (
+    <div className="p-4">
+      <p className={`text-xs ${labelClassName} font-medium mb-2`}>{label}</p>
+      <h4 className="text-white font-bold">{companyId}</h4>
+      <p className="text-slate-400 text-sm">{sector}</p>
+      <p className="text-white font-medium mt-2">{valueBanded}</p>
+      <div className="mt-2 text-xs">
+        <span className="text-slate-400">{fitLabel}: </span>
+        <span className="text-accent-teal">+{fitImprovement?.toFixed(0)}%</span>
+      </div>
+    </div>
+  )
+}
+
 export default function Swaps() {
   const [activeTab, setActiveTab] = useState('auto')
   const [inclusionOnly, setInclusionOnly] = useState(false)
@@ -21,12 +53,22 @@ export default function Swaps() {
   const { balance } = useCreditsStore()
   const queryClient = useQueryClient()
 
-  const { data: autoMatches } = useQuery({
-    queryKey: ['auto-swaps', currentLender?.id, inclusionOnly],
-    queryFn: () => swapsApi.getAutoMatches(currentLender!.id, inclusionOnly).then((res) => res.data),
+  // Fetch every match once and apply the inclusion toggle locally, so
+  // flipping the checkbox never triggers another request
+  const { data: allMatches } = useQuery({
+    queryKey: ['auto-swaps', currentLender?.id],
+    queryFn: () => swapsApi.getAutoMatches(currentLender!.id).then((res) => res.data),
     enabled: !!currentLender?.id,
   })
 
+  const autoMatches = useMemo(
+    () =>
+      inclusionOnly
+        ? allMatches?.filter((match: { is_inclusion_swap: boolean }) => match.is_inclusion_swap)
+        : allMatches,
+    [allMatches, inclusionOnly]
+  )
+
   const { data: proposals } = useQuery({
     queryKey: ['my-proposals', currentLender?.id],
     queryFn: () => swapsApi.getMyProposals(currentLender!.id).then((res) => res.data),
@@ -34,11 +76,21 @@ export default function Swaps() {
   })
 
   const { data: myLoans } = useQuery({
-    queryKey: ['my-loans-for-swap', currentLender?.id],
+    queryKey: ['my-loans', currentLender?.id],
     queryFn: () => marketplaceApi.getMyLoans(currentLender!.id, true).then((res) => res.data),
     enabled: !!currentLender?.id && activeTab === 'manual',
   })
 
+  const myLoanOptions = useMemo(
+    () =>
+      myLoans?.map((loan: any) => (
+        <option key={loan.loan_id} value={loan.loan_id}>
+          {loan.company_id} - {loan.sector} ({loan.outstanding_balance_banded})
+        </option>
+      )),
+    [myLoans]
+  )
+
   const acceptMutation = useMutation({
     mutationFn: (proposalId: number) => swapsApi.acceptProposal(proposalId, currentLender!.id),
     onSuccess: () => queryClient.invalidateQueries({ queryKey: ['my-proposals'] }),
@@ -90,8 +142,10 @@ export default function Swaps() {
 
               {autoMatches?.length > 0 ? (
                 <div className="grid grid-cols-1 xl:grid-cols-2 gap-6">
-                  {autoMatches.map((match: any, index: number) => (
-                    <Card key={index} padding="none">
+                  {autoMatches.map((match: any) => (
+                    // Keyed by the loan pair so toggling the inclusion filter
+                    // keeps each card's DOM instead of re-rendering shifted slots
+                    <Card key={`${match.give_loan_id}-${match.receive_loan_id}`} padding="none">
                       <div className="p-4 border-b border-slate-800">
                         <div className="flex items-center justify-between">
                           <div className="flex items-center gap-2">
@@ -109,29 +163,24 @@ export default function Swaps() {
                       </div>
 
                       <div className="grid grid-cols-2 divide-x divide-slate-800">
-                        {/* Give */}
-                        <div className="p-4">
-                          <p className="text-xs text-orange-400 font-medium mb-2">YOU GIVE</p>
-                          <h4 className="text-white font-bold">{match.give_company_id}</h4>
-                          <p className="text-slate-400 text-sm">{match.give_sector}</p>
-                          <p className="text-white font-medium mt-2">{match.give_value_banded}</p>
-                          <div className="mt-2 text-xs">
-                            <span className="text-slate-400">Fit improvement for them: </span>
-                            <span className="text-accent-teal">+{match.give_fit_improvement?.toFixed(0)}%</span>
-                          </div>
-                        </div>
-
-                        {/* Receive */}
-                        <div className="p-4">
-                          <p className="text-xs text-accent-teal font-medium mb-2">YOU RECEIVE</p>
-                          <h4 className="text-white font-bold">{match.receive_company_id}</h4>
-                          <p className="text-slate-400 text-sm">{match.receive_sector}</p>
-                          <p className="text-white font-medium mt-2">{match.receive_value_banded}</p>
-                          <div className="mt-2 text-xs">
-                            <span className="text-slate-400">Fit improvement for you: </span>
-                            <span className="text-accent-teal">+{match.receive_fit_improvement?.toFixed(0)}%</span>
-                          </div>
-                        </div>
+                        <SwapSide
+                          label="YOU GIVE"
+                          labelClassName="text-orange-400"
+                          companyId={match.give_company_id}
+                          sector={match.give_sector}
+                          valueBanded={match.give_value_banded}
+                          fitLabel="Fit improvement for them"
+                          fitImprovement={match.give_fit_improvement}
+                        />
+                        <SwapSide
+                          label="YOU RECEIVE"
+                          labelClassName="text-accent-teal"
+                          companyId={match.receive_company_id}
+                          sector={match.receive_sector}
+                          valueBanded={match.receive_value_banded}
+                          fitLabel="Fit improvement for you"
+                          fitImprovement={match.receive_fit_improvement}
+                        />
                       </div>
 
                       <div className="p-4 border-t border-slate-800 flex items-center justify-between">
@@ -180,11 +229,7 @@ export default function Swaps() {
                     </label>
                     <select className="w-full bg-slate-800 border-slate-700 text-sm text-white rounded px-3 py-2 focus:ring-primary">
                       <option value="">Select a loan...</option>
-                      {myLoans?.map((loan: any) => (
-                        <option key={loan.loan_id} value={loan.loan_id}>
-                          {loan.company_id} - {loan.sector} ({loan.outstanding_balance_banded})
-                        </option>
-                      ))}
+                      {myLoanOptions}
                     </select>
                   </div>
                   <Button variant="primary" icon="arrow_forward">
@@ -7,12 +7,17 @@ const api = axios.create({
   },
 })
 
+// Portfolio and market aggregates are served from a backend cache that only
+// changes when the dataset is reloaded, so queries for them never go stale
+export const STATIC_STALE_TIME = Infinity
+
 // Portfolio API
 export const portfolioApi = {
   getOverview: () => api.get('/portfolio/overview'),
   getBySector: () => api.get('/portfolio/by-sector'),
   getByRegion: (grouped = true) => api.get('/portfolio/by-region', { params: { grouped } }),
   getLenderDistribution: () => api.get('/portfolio/lender-distribution'),
+  getScoreDistribution: (bins = 20) => api.get('/portfolio/score-distribution', { params: { bins } }),
   getCompanies: (params?: { skip?: number; limit?: number; sector?: string; region?: string }) =>
     api.get('/portfolio/companies', { params }),
 }
@@ -78,6 +78,37 @@ def get_lender_names() -> list:
     return list(LENDERS.keys())
 
 
+def _format_profile_fields(lender: dict) -> dict:
+    """Format the display fields that do not depend on anonymization."""
+    sectors = lender['preferred_sectors'] if lender['preferred_sectors'] else ['All sectors']
+    regions = lender['preferred_regions'] if lender['preferred_regions'] else ['National']
+
+    return {
+        'risk_appetite': f"{lender['risk_tolerance'].title()} (min score: {lender['risk_score_min']})",
+        'sectors': ', '.join(sectors),
+        'regions': ', '.join(regions),
+        'size_range': f"£{lender['min_turnover']/1_000_000:.0f}m - " + ('No limit' if not lender['max_turnover'] else f"£{lender['max_turnover']/1_000_000:.0f}m"),
+        'inclusion_focus': 'Yes' if lender['inclusion_mandate'] else 'No',
+        'color': lender['color']
+    }
+
+
+# Profiles are static, so each lender's display entry is built once at import;
+# only the anonymized name depends on the current lender mapping
+_LENDER_DISPLAY = {
+    name: {
+        'name': lender['name'],
+        'description': lender['description'],
+        **_format_profile_fields(lender)
+    }
+    for name, lender in LENDERS.items()
+}
+_ANONYMIZED_DESCRIPTIONS = {
+    name: f"Alternative lender with {lender['risk_tolerance']} risk tolerance"
+    for name, lender in LENDERS.items()
+}
+
+
 def get_lender_for_display(name: str, anonymize: bool = False, is_current: bool = False) -> dict:
     """
     Get lender info formatted for UI display.
@@ -87,33 +118,21 @@ def get_lender_for_display(name: str, anonymize: bool = False, is_current: bool
         anonymize: If True, anonymize the lender identity
         is_current: If True, show actual name even when anonymizing (current lender)
     """
-    lender = LENDERS.get(name)
-    if not lender:
+    display = _LENDER_DISPLAY.get(name)
+    if not display:
         return None
 
-    sectors = lender['preferred_sectors'] if lender['preferred_sectors'] else ['All sectors']
-    regions = lender['preferred_regions'] if lender['preferred_regions'] else ['National']
-
-    # Determine display name
     if anonymize and not is_current:
         from utils.anonymizer import anonymize_lender
-        display_name = anonymize_lender(name, is_current=False)
         # Also anonymize description for non-current lenders
-        display_desc = f"Alternative lender with {lender['risk_tolerance']} risk tolerance"
-    else:
-        display_name = lender['name']
-        display_desc = lender['description']
-
-    return {
-        'name': display_name,
-        'description': display_desc,
-        'risk_appetite': f"{lender['risk_tolerance'].title()} (min score: {lender['risk_score_min']})",
-        'sectors': ', '.join(sectors),
-        'regions': ', '.join(regions),
-        'size_range': f"£{lender['min_turnover']/1_000_000:.0f}m - " + ('No limit' if not lender['max_turnover'] else f"£{lender['max_turnover']/1_000_000:.0f}m"),
-        'inclusion_focus': 'Yes' if lender['inclusion_mandate'] else 'No',
-        'color': lender['color']
-    }
+        return {
+            **display,
+            'name': anonymize_lender(name, is_current=False),
+            'description': _ANONYMIZED_DESCRIPTIONS[name]
+        }
+
+    # Copy so callers can modify their entry without touching the cache
+    return dict(display)
 
 
 def get_anonymized_lender_name(name: str, current_lender: str = None) -> str:
@@ -5,7 +5,12 @@ This module provides functions to anonymize sensitive data while maintaining
 analytical value. Key principle: Current lender visible, alternatives anonymized.
 """
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from lenders.profiles import LENDERS
 
 
 # Geographic groupings
@@ -60,8 +65,14 @@ def reset_lender_mapping():
     global _lender_mapping, _lender_counter
     _lender_mapping = {}
     _lender_counter = 0
+    # Memoized labels belong to the old mapping
+    anonymize_lender.cache_clear()
+    anonymize_lender_for_lender_view.cache_clear()
 
 
+# Labels are stable until reset_lender_mapping(), and the input domain is
+# small (lenders x contexts), so repeat calls are served from a cache
+@lru_cache(maxsize=256)
 def anonymize_lender(
     name: str, is_current: bool = False, context: str = "default"
 ) -> str:
@@ -94,6 +105,30 @@ def anonymize_lender(
     return _lender_mapping[key]
 
 
+def build_lender_anon_map(
+    names: Iterable[str], context: str = "default"
+) -> Dict[str, str]:
+    """
+    Anonymize a collection of lender names in one pass.
+
+    Labels are assigned through anonymize_lender in first-seen order, so the
+    result agrees with any per-name calls made in the same context.
+
+    Args:
+        names: Lender names to anonymize (duplicates are ignored)
+        context: Context identifier for different anonymization scopes
+
+    Returns:
+        Mapping of actual name to anonymized identifier, suitable for
+        Series.map or plain dict lookups
+    """
+    return {
+        name: anonymize_lender(name, is_current=False, context=context)
+        for name in dict.fromkeys(names)
+    }
+
+
+@lru_cache(maxsize=256)
 def anonymize_lender_for_lender_view(name: str, selected_lender: str) -> str:
     """
     Anonymize lender names for the Lender View page.
@@ -110,6 +145,9 @@ def anonymize_lender_for_lender_view(name: str, selected_lender: str) -> str:
     return anonymize_lender(name, is_current=False, context="lender_view")
 
 
+# Per-record callers band the same amounts again on every render; each band
+# is a linear scan over the thresholds, so results are memoized
+@lru_cache(maxsize=4096)
 def band_loan_amount(amount: float) -> str:
     """
     Convert a loan amount to a banded range.
@@ -126,6 +164,7 @@ def band_loan_amount(amount: float) -> str:
     return LOAN_BANDS[-1][1]
 
 
+@lru_cache(maxsize=4096)
 def band_turnover(amount: float) -> str:
     """
     Convert turnover to a banded range.
@@ -142,6 +181,7 @@ def band_turnover(amount: float) -> str:
     return TURNOVER_BANDS[-1][1]
 
 
+@lru_cache(maxsize=4096)
 def band_portfolio_total(amount: float) -> str:
     """
     Convert portfolio total to a banded range.
@@ -158,6 +198,31 @@ def band_portfolio_total(amount: float) -> str:
     return PORTFOLIO_BANDS[-1][1]
 
 
+def _band_labels(amounts, bands: List[Tuple[float, str]]) -> np.ndarray:
+    """
+    Band a whole array of amounts in one pass.
+
+    Equivalent to the scalar band_* functions: each value gets the label of
+    the first threshold it is strictly below (NaN falls into the last band).
+
+    Args:
+        amounts: Array-like of amounts in GBP
+        bands: Band table of (threshold, label), thresholds ascending
+
+    Returns:
+        Array of band labels
+    """
+    thresholds = np.array([threshold for threshold, _ in bands], dtype=float)
+    labels = np.array([label for _, label in bands], dtype=object)
+    codes = np.searchsorted(thresholds, np.asarray(amounts, dtype=float), side="right")
+    return labels[np.minimum(codes, len(bands) - 1)]
+
+
+def band_loan_amounts(amounts) -> np.ndarray:
+    """Vectorized band_loan_amount over an array of amounts."""
+    return _band_labels(amounts, LOAN_BANDS)
+
+
 def format_amount_range(amount: float) -> str:
     """
     Format an amount as a range for detailed views.
@@ -238,9 +303,7 @@ def anonymize_fit_reason(reason: str, current_lender: str) -> str:
     Returns:
         The reason with alternative lenders anonymized
     """
-    # Get list of all lender names that might appear
-    from lenders.profiles import LENDERS
-
+    # Check every lender name that might appear
     result = reason
     for lender_name in LENDERS.keys():
         if lender_name != current_lender and lender_name in result:
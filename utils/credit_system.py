@@ -4,7 +4,7 @@ Manages per-transaction credits for the GFA Exchange platform.
 """
 
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 
 
 class CreditManager:
@@ -64,6 +64,10 @@ class CreditManager:
         self.credits = initial_credits
         self.initial_credits = initial_credits
         self.transaction_log: List[Dict] = []
+        # (action, item_id) pairs already paid for, for O(1) lookups
+        self._paid_items: Set[Tuple[str, Optional[str]]] = set()
+        # Running per-action counts, updated on every logged transaction
+        self._action_counts: Dict[str, int] = {}
 
     def check_balance(self) -> int:
         """Get current credit balance."""
@@ -109,6 +113,8 @@ class CreditManager:
                 'timestamp': datetime.now(),
                 'balance_after': self.credits
             })
+            self._paid_items.add((action, item_id))
+            self._count_action(action)
             return True
         return False
 
@@ -122,7 +128,11 @@ class CreditManager:
 
     def get_action_count(self, action: str) -> int:
         """Get count of times an action was performed."""
-        return sum(1 for t in self.transaction_log if t['action'] == action)
+        return self._action_counts.get(action, 0)
+
+    def _count_action(self, action: str) -> None:
+        """Increment the running count for an action."""
+        self._action_counts[action] = self._action_counts.get(action, 0) + 1
 
     def has_viewed_item(self, action: str, item_id: str) -> bool:
         """
@@ -135,10 +145,7 @@ class CreditManager:
         Returns:
             True if already paid, so no need to charge again
         """
-        for t in self.transaction_log:
-            if t['action'] == action and t['item_id'] == item_id:
-                return True
-        return False
+        return (action, item_id) in self._paid_items
 
     def add_credits(self, amount: int, reason: str = "purchase") -> None:
         """
@@ -157,11 +164,14 @@ class CreditManager:
             'timestamp': datetime.now(),
             'balance_after': self.credits
         })
+        self._count_action('credit_added')
 
     def reset(self) -> None:
         """Reset to initial state (for demo purposes)."""
         self.credits = self.initial_credits
         self.transaction_log = []
+        self._paid_items = set()
+        self._action_counts = {}
 
     def get_summary(self) -> Dict:
         """Get summary statistics."""
@@ -169,7 +179,7 @@ class CreditManager:
             'current_balance': self.credits,
             'initial_balance': self.initial_credits,
             'total_spent': self.get_spent_total(),
-            'total_transactions': len([t for t in self.transaction_log if t['action'] != 'credit_added']),
+            'total_transactions': len(self.transaction_log) - self.get_action_count('credit_added'),
             'details_viewed': self.get_action_count('view_details'),
             'explanations_generated': self.get_action_count('generate_explanation'),
             'interests_expressed': self.get_action_count('express_interest'),
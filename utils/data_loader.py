@@ -15,20 +15,39 @@ LENDER_NAMES = [
     "Sector Specialist Credit"
 ]
 
+# Label columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['Sector', 'Region', 'Current_Lender']
+
+# Small simulated year counts (at most 7), stored in the narrowest integer type
+YEAR_COLUMNS = ['Loan_Term_Years', 'Years_Paid', 'Years_Remaining']
+
 # Seed for reproducibility
 random.seed(41)
 
 
-def load_data(excel_path: str) -> pd.DataFrame:
+def read_excel_sheets(excel_path: str) -> pd.DataFrame:
     """
-    Load all sheets from the Excel file and combine into single DataFrame.
+    Read every sheet of the Excel file into one DataFrame tagged by sector.
+
+    Parsing the workbook dominates cold-start time, so the combined sheets
+    are also pickled alongside it and read from there while the workbook is
+    unchanged. Pickle rather than Parquet: several sheet columns mix text
+    and numbers, which Parquet cannot store as-is.
 
     Args:
         excel_path: Path to the Excel file
 
     Returns:
-        DataFrame with all companies and their sector labels
+        DataFrame with the raw sheet rows and a Sector column
     """
+    excel_file = Path(excel_path)
+    cache_file = excel_file.with_suffix('.pkl')
+    if (
+        cache_file.exists()
+        and cache_file.stat().st_mtime >= excel_file.stat().st_mtime
+    ):
+        return pd.read_pickle(cache_file)
+
     xl = pd.ExcelFile(excel_path)
 
     all_data = []
@@ -39,6 +58,27 @@ def load_data(excel_path: str) -> pd.DataFrame:
 
     combined = pd.concat(all_data, ignore_index=True)
 
+    try:
+        combined.to_pickle(cache_file)
+    except OSError:
+        # Read-only data dir: keep reading the workbook
+        pass
+
+    return combined
+
+
+def load_data(excel_path: str) -> pd.DataFrame:
+    """
+    Load all sheets from the Excel file and combine into single DataFrame.
+
+    Args:
+        excel_path: Path to the Excel file
+
+    Returns:
+        DataFrame with all companies and their sector labels
+    """
+    combined = read_excel_sheets(excel_path)
+
     # Clean data
     combined = clean_data(combined)
 
@@ -55,6 +95,12 @@ def load_data(excel_path: str) -> pd.DataFrame:
     # Generate anonymized IDs
     combined['SME_ID'] = [f"SME_{str(i).zfill(4)}" for i in range(len(combined))]
 
+    # Low-cardinality labels as categoricals: filters compare integer codes
+    # and the distinct values are available from .cat.categories without a scan
+    for col in CATEGORICAL_COLUMNS:
+        if col in combined.columns:
+            combined[col] = combined[col].astype('category')
+
     return combined
 
 
@@ -145,6 +191,9 @@ def add_loan_simulation(df: pd.DataFrame) -> pd.DataFrame:
     """
     loan_details = df.apply(simulate_loan_details, axis=1)
     loan_df = pd.DataFrame(loan_details.tolist())
+    loan_df[YEAR_COLUMNS] = loan_df[YEAR_COLUMNS].apply(
+        pd.to_numeric, downcast='integer'
+    )
 
     return pd.concat([df, loan_df], axis=1)
 